@@ -18,7 +18,8 @@
 #
 # (c) 2021, Blender Foundation - Paul Golter
 
-from typing import Any, List, Union, Dict, Tuple
+import time
+from typing import Any, List, Optional, Union, Dict, Tuple
 
 import bpy
 
@@ -50,7 +51,8 @@ _shot_active: Shot = Shot()
 _asset_active: Asset = Asset()
 _asset_type_active: AssetType = AssetType()
 _task_type_active: TaskType = TaskType()
-_user_active: User = User()
+# User() requests the current user from the server, so only create it when needed.
+_user_active: Optional[User] = None
 _user_all_tasks: List[Task] = []
 
 _cache_initialized: bool = False
@@ -66,6 +68,48 @@ _task_types_shots_enum_list: List[Tuple[str, str, str]] = []
 _task_statuses_enum_list: List[Tuple[str, str, str]] = []
 _user_all_tasks_enum_list: List[Tuple[str, str, str]] = []
 
+# Blender calls enum item callbacks many times while a search popup is open.
+# Every call would request the entities again (or deep copy them from the
+# server cache) just to create the same list, so the lists are only rebuilt
+# when the entity they depend on changed, the server cache was cleared, or
+# they are older than _ENUM_LIST_EXPIRE seconds.
+_ENUM_LIST_EXPIRE: float = 5.0
+_enum_list_keys: Dict[str, Tuple[Tuple[Any, int], float]] = {}
+
+# Entities that the project, sequence and asset type enum lists were built
+# from, by id. These are the same as what by_id() would return, so when users
+# pick an item the active entity doesn't need to be requested again.
+_enum_list_entities: Dict[str, Any] = {}
+
+
+def enum_list_is_valid(list_name: str, key: Any) -> bool:
+    cached = _enum_list_keys.get(list_name)
+    if not cached:
+        return False
+
+    cached_key, timestamp = cached
+    return (
+        cached_key == (key, Cache.generation)
+        and time.monotonic() - timestamp < _ENUM_LIST_EXPIRE
+    )
+
+
+def enum_list_set_valid(list_name: str, key: Any) -> None:
+    _enum_list_keys[list_name] = ((key, Cache.generation), time.monotonic())
+
+
+def entity_by_id(entity_type: Any, entity_id: str) -> Any:
+    entity = _enum_list_entities.get(entity_id)
+    if isinstance(entity, entity_type):
+        return entity
+    return entity_type.by_id(entity_id)
+
+
+def clear_enum_list_cache() -> None:
+    _enum_list_keys.clear()
+    _enum_list_entities.clear()
+    logger.debug("Cleared enum list cache")
+
 
 def _addon_prefs_get(context: bpy.types.Context) -> bpy.types.AddonPreferences:
     """
@@ -77,6 +121,8 @@ def _addon_prefs_get(context: bpy.types.Context) -> bpy.types.AddonPreferences:
 def user_active_get() -> User:
     global _user_active
 
+    if _user_active is None:
+        _user_active = User()
     return _user_active
 
 
@@ -89,7 +135,7 @@ def project_active_get() -> Project:
 def project_active_set_by_id(context: bpy.types.Context, entity_id: str) -> None:
     global _project_active
 
-    _project_active = Project.by_id(entity_id)
+    _project_active = entity_by_id(Project, entity_id)
     _addon_prefs_get(context).project_active_id = entity_id
     logger.debug("Set active project to %s", _project_active.name)
 
@@ -108,7 +154,7 @@ def sequence_active_get() -> Sequence:
 def sequence_active_set_by_id(context: bpy.types.Context, entity_id: str) -> None:
     global _sequence_active
 
-    _sequence_active = Sequence.by_id(entity_id)
+    _sequence_active = entity_by_id(Sequence, entity_id)
     context.scene.kitsu.sequence_active_id = entity_id
     logger.debug("Set active sequence to %s", _sequence_active.name)
 
@@ -182,7 +228,7 @@ def asset_type_active_get() -> AssetType:
 def asset_type_active_set_by_id(context: bpy.types.Context, entity_id: str) -> None:
     global _asset_type_active
 
-    _asset_type_active = AssetType.by_id(entity_id)
+    _asset_type_active = entity_by_id(AssetType, entity_id)
     context.scene.kitsu.asset_type_active_id = entity_id
     logger.debug("Set active asset type to %s", _asset_type_active.name)
 
@@ -225,11 +271,16 @@ def get_projects_enum_list(
     if not _addon_prefs_get(context).session.is_auth():
         return []
 
+    if enum_list_is_valid("projects", None):
+        return _projects_enum_list
+
     projectlist = ProjectList()
+    _enum_list_entities.update({p.id: p for p in projectlist.projects})
     _projects_enum_list.clear()
     _projects_enum_list.extend(
         [(p.id, p.name, p.description or "") for p in projectlist.projects]
     )
+    enum_list_set_valid("projects", None)
     return _projects_enum_list
 
 
@@ -242,13 +293,14 @@ def get_sequences_enum_list(
     if not project_active:
         return []
 
+    if enum_list_is_valid("sequences", project_active.id):
+        return _sequence_enum_list
+
+    sequences = project_active.get_sequences_all()
+    _enum_list_entities.update({s.id: s for s in sequences})
     _sequence_enum_list.clear()
-    _sequence_enum_list.extend(
-        [
-            (s.id, s.name, s.description or "")
-            for s in project_active.get_sequences_all()
-        ]
-    )
+    _sequence_enum_list.extend([(s.id, s.name, s.description or "") for s in sequences])
+    enum_list_set_valid("sequences", project_active.id)
     return _sequence_enum_list
 
 
@@ -262,10 +314,14 @@ def get_shots_enum_for_active_seq(
     if not zseq_active:
         return []
 
+    if enum_list_is_valid("shots", zseq_active.id):
+        return _shot_enum_list
+
     _shot_enum_list.clear()
     _shot_enum_list.extend(
         [(s.id, s.name, s.description or "") for s in zseq_active.get_all_shots()]
     )
+    enum_list_set_valid("shots", zseq_active.id)
     return _shot_enum_list
 
 
@@ -278,10 +334,14 @@ def get_assetypes_enum_list(
     if not project_active:
         return []
 
+    if enum_list_is_valid("asset_types", project_active.id):
+        return _asset_types_enum_list
+
+    asset_types = project_active.get_all_asset_types()
+    _enum_list_entities.update({at.id: at for at in asset_types})
     _asset_types_enum_list.clear()
-    _asset_types_enum_list.extend(
-        [(at.id, at.name, "") for at in project_active.get_all_asset_types()]
-    )
+    _asset_types_enum_list.extend([(at.id, at.name, "") for at in asset_types])
+    enum_list_set_valid("asset_types", project_active.id)
     return _asset_types_enum_list
 
 
@@ -296,6 +356,10 @@ def get_assets_enum_for_active_asset_type(
     if not project_active or not asset_type_active:
         return []
 
+    key = (project_active.id, asset_type_active.id)
+    if enum_list_is_valid("assets", key):
+        return _asset_enum_list
+
     _asset_enum_list.clear()
     _asset_enum_list.extend(
         [
@@ -303,6 +367,7 @@ def get_assets_enum_for_active_asset_type(
             for a in project_active.get_all_assets_for_type(asset_type_active)
         ]
     )
+    enum_list_set_valid("assets", key)
     return _asset_enum_list
 
 
@@ -311,21 +376,26 @@ def get_task_types_enum_for_current_context(
 ) -> List[Tuple[str, str, str]]:
     global _task_types_enum_list
 
+    category = context.scene.kitsu.category
+    if category == "SHOTS" and not shot_active_get():
+        return []
+    if category == "ASSETS" and not asset_active_get():
+        return []
+
+    # The task types only depend on the category, not on the active entity.
+    if enum_list_is_valid("task_types", category):
+        return _task_types_enum_list
+
     items = []
-    if context.scene.kitsu.category == "SHOTS":
-        shot_active = shot_active_get()
-        if not shot_active:
-            return []
+    if category == "SHOTS":
         items = [(t.id, t.name, "") for t in TaskType.all_shot_task_types()]
 
-    if context.scene.kitsu.category == "ASSETS":
-        asset_active = asset_active_get()
-        if not asset_active:
-            return []
+    if category == "ASSETS":
         items = [(t.id, t.name, "") for t in TaskType.all_asset_task_types()]
 
     _task_types_enum_list.clear()
     _task_types_enum_list.extend(items)
+    enum_list_set_valid("task_types", category)
 
     return _task_types_enum_list
 
@@ -335,10 +405,14 @@ def get_shot_task_types_enum(
 ) -> List[Tuple[str, str, str]]:
     global _task_types_shots_enum_list
 
+    if enum_list_is_valid("task_types_shots", None):
+        return _task_types_shots_enum_list
+
     items = [(t.id, t.name, "") for t in TaskType.all_shot_task_types()]
 
     _task_types_shots_enum_list.clear()
     _task_types_shots_enum_list.extend(items)
+    enum_list_set_valid("task_types_shots", None)
 
     return _task_types_shots_enum_list
 
@@ -348,25 +422,29 @@ def get_all_task_statuses_enum(
 ) -> List[Tuple[str, str, str]]:
     global _task_statuses_enum_list
 
+    if enum_list_is_valid("task_statuses", None):
+        return _task_statuses_enum_list
+
     items = [(t.id, t.name, "") for t in TaskStatus.all_task_statuses()]
 
     _task_statuses_enum_list.clear()
     _task_statuses_enum_list.extend(items)
+    enum_list_set_valid("task_statuses", None)
 
     return _task_statuses_enum_list
 
 
 def load_user_all_tasks(context: bpy.types.Context) -> List[Task]:
     global _user_all_tasks
-    global _user_active
 
-    tasks = _user_active.all_tasks_to_do()
+    user_active = user_active_get()
+    tasks = user_active.all_tasks_to_do()
     _user_all_tasks.clear()
     _user_all_tasks.extend(tasks)
 
     _update_tasks_collection_prop(context)
 
-    logger.debug("Loaded assigned tasks for: %s", _user_active.full_name)
+    logger.debug("Loaded assigned tasks for: %s", user_active.full_name)
 
     return _user_all_tasks
 
@@ -418,20 +496,29 @@ def _init_cache_entity(
     entity_id: str, entity_type: Any, cache_variable_name: Any, cache_name: str
 ) -> None:
 
-    if entity_id:
-        try:
-            globals()[cache_variable_name] = entity_type.by_id(entity_id)
-            logger.debug(
-                "Initiated active %s cache to: %s",
-                cache_name,
-                globals()[cache_variable_name].name,
-            )
-        except RouteNotFoundException:
-            logger.error(
-                "Failed to initialize active %s cache. ID not found on server: %s",
-                cache_name,
-                entity_id,
-            )
+    if not entity_id:
+        globals()[cache_variable_name] = entity_type()
+        return
+
+    # Entity is still active, eg. when reopening a file of the same project.
+    if globals()[cache_variable_name].id == entity_id:
+        logger.debug("Active %s cache already set to: %s", cache_name, entity_id)
+        return
+
+    try:
+        globals()[cache_variable_name] = entity_type.by_id(entity_id)
+        logger.debug(
+            "Initiated active %s cache to: %s",
+            cache_name,
+            globals()[cache_variable_name].name,
+        )
+    except RouteNotFoundException:
+        globals()[cache_variable_name] = entity_type()
+        logger.error(
+            "Failed to initialize active %s cache. ID not found on server: %s",
+            cache_name,
+            entity_id,
+        )
 
 
 def init_startup_variables(context: bpy.types.Context) -> None:
@@ -464,7 +551,7 @@ def clear_startup_variables():
     global _user_all_tasks
     global _cache_startup_initialized
 
-    _user_active = User()
+    _user_active = None
     logger.debug("Cleared active user cache")
 
     _user_all_tasks.clear()
@@ -492,21 +579,23 @@ def init_cache_variables() -> None:
         logger.debug("Cache already initiated")
         return
 
-    project_active_id = addon_prefs.project_active_id
-    sequence_active_id = bpy.context.scene.kitsu.sequence_active_id
-    shot_active_id = bpy.context.scene.kitsu.shot_active_id
-    asset_active_id = bpy.context.scene.kitsu.asset_active_id
-    asset_type_active_id = bpy.context.scene.kitsu.asset_type_active_id
-    task_type_active_id = bpy.context.scene.kitsu.task_type_active_id
-
-    _init_cache_entity(project_active_id, Project, "_project_active", "project")
-    _init_cache_entity(sequence_active_id, Sequence, "_sequence_active", "sequence")
-    _init_cache_entity(
-        asset_type_active_id, AssetType, "_asset_type_active", "asset type"
-    )
-    _init_cache_entity(shot_active_id, Shot, "_shot_active", "shot")
-    _init_cache_entity(asset_active_id, Asset, "_asset_active", "asset")
-    _init_cache_entity(task_type_active_id, TaskType, "_task_type_active", "task type")
+    scene_kitsu = bpy.context.scene.kitsu
+
+    # The requests stay sequential, gazu's cache is not thread safe.
+    for entity_id, entity_type, cache_variable_name, cache_name in (
+        (addon_prefs.project_active_id, Project, "_project_active", "project"),
+        (scene_kitsu.sequence_active_id, Sequence, "_sequence_active", "sequence"),
+        (
+            scene_kitsu.asset_type_active_id,
+            AssetType,
+            "_asset_type_active",
+            "asset type",
+        ),
+        (scene_kitsu.shot_active_id, Shot, "_shot_active", "shot"),
+        (scene_kitsu.asset_active_id, Asset, "_asset_active", "asset"),
+        (scene_kitsu.task_type_active_id, TaskType, "_task_type_active", "task type"),
+    ):
+        _init_cache_entity(entity_id, entity_type, cache_variable_name, cache_name)
 
     _cache_initialized = True
 
@@ -520,9 +609,6 @@ def clear_cache_variables():
     global _task_type_active
     global _cache_initialized
 
-    _user_active = User()
-    logger.debug("Cleared active user cache")
-
     _shot_active = Shot()
     logger.debug("Cleared active shot cache")
 
@@ -541,12 +627,20 @@ def clear_cache_variables():
     _task_type_active = TaskType()
     logger.debug("Cleared active task type cache")
 
+    clear_enum_list_cache()
+
     _cache_initialized = False
 
 
 @persistent
 def load_post_handler_update_cache(dummy: Any) -> None:
-    clear_cache_variables()
+    global _cache_initialized
+
+    # Don't clear the active entities, init_cache_variables() only requests
+    # the ones whose id differs in the loaded file. The session ending
+    # clears them completely.
+    clear_enum_list_cache()
+    _cache_initialized = False
     init_cache_variables()
 
 
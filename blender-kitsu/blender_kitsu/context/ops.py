@@ -82,7 +82,7 @@ class KITSU_OT_con_sequences_load(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
-        return bool(prefs.session_auth(context) and cache.project_active_get())
+        return bool(cache.project_active_get() and prefs.session_auth(context))
 
     def execute(self, context: bpy.types.Context) -> Set[str]:
 
@@ -120,8 +120,8 @@ class KITSU_OT_con_shots_load(bpy.types.Operator):
     def poll(cls, context: bpy.types.Context) -> bool:
         # Only if session is auth active_project and active sequence selected.
         return bool(
-            prefs.session_auth(context)
-            and cache.sequence_active_get()
+            cache.sequence_active_get()
+            and prefs.session_auth(context)
             and cache.project_active_get()
         )
 
@@ -151,7 +151,7 @@ class KITSU_OT_con_asset_types_load(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
-        return bool(prefs.session_auth(context) and cache.project_active_get())
+        return bool(cache.project_active_get() and prefs.session_auth(context))
 
     def execute(self, context: bpy.types.Context) -> Set[str]:
         # Store vars to check if project / seq / shot changed.
@@ -187,8 +187,8 @@ class KITSU_OT_con_assets_load(bpy.types.Operator):
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
         return bool(
-            prefs.session_auth(context)
-            and cache.project_active_get()
+            cache.project_active_get()
+            and prefs.session_auth(context)
             and cache.asset_type_active_get()
         )
 
@@ -221,7 +221,7 @@ class KITSU_OT_con_task_types_load(bpy.types.Operator):
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
         addon_prefs = prefs.addon_prefs_get(context)
-        precon = bool(prefs.session_auth(context) and cache.project_active_get())
+        precon = bool(cache.project_active_get() and prefs.session_auth(context))
 
         if context.scene.kitsu.category == "SHOTS":
             return bool(
@@ -258,8 +258,8 @@ class KITSU_OT_con_detect_context(bpy.types.Operator):
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
         return bool(
-            prefs.session_auth(context)
-            and cache.project_active_get()
+            cache.project_active_get()
+            and prefs.session_auth(context)
             and bpy.data.filepath
         )
 
@@ -92,35 +92,40 @@ class KITSU_property_group_sequence(bpy.types.PropertyGroup):
 
     def to_dict(self):
         return {
-            "id": self.id,
-            "name": self.shot,
-            "sequence_name": self.sequence,
-            "description": self.description,
+            "id": self.shot_id,
+            "name": self.shot_name,
+            "sequence_name": self.sequence_name,
+            "description": self.shot_description,
         }
 
-    def clear(self):
-        self.shot_id = ""
-        self.shot_name = ""
-        self.shot_description = ""
-
-        self.sequence_id = ""
-        self.sequence_name = ""
-
-        self.project_name = ""
-        self.project_id = ""
+    def _reset(self, *prop_names: str) -> None:
+        # Only write properties that are set, writing to an RNA property
+        # sends an update even if the value does not change.
+        for prop_name in prop_names:
+            if getattr(self, prop_name):
+                self.property_unset(prop_name)
 
-        self.initialized = False
-        self.linked = False
-
-        self.frame_start_offset = 0
+    def clear(self):
+        self._reset(
+            "shot_id",
+            "shot_name",
+            "shot_description",
+            "sequence_id",
+            "sequence_name",
+            "project_name",
+            "project_id",
+            "initialized",
+            "linked",
+            "frame_start_offset",
+        )
 
     def unlink(self):
-        self.sequence_id = ""
-
-        self.project_name = ""
-        self.project_id = ""
-
-        self.linked = False
+        self._reset(
+            "sequence_id",
+            "project_name",
+            "project_id",
+            "linked",
+        )
 
 
 class KITSU_property_group_scene(bpy.types.PropertyGroup):
@@ -34,6 +34,10 @@ from blender_kitsu.logger import LoggerFactory
 
 logger = LoggerFactory.getLogger()
 
+# Python must keep a reference to the strings returned by enum item callbacks,
+# otherwise Blender may read freed memory.
+_sequence_enum_list: List[Tuple[str, str, str]] = []
+
 # Get functions for window manager properties.
 def _get_project_active(self):
     return cache.project_active_get().name
@@ -61,14 +65,25 @@ def _resolve_pattern(pattern: str, var_lookup_table: Dict[str, str]) -> str:
 
 
 def _get_sequences(self: Any, context: bpy.types.Context) -> List[Tuple[str, str, str]]:
+    global _sequence_enum_list
+
     addon_prefs = bpy.context.preferences.addons["blender_kitsu"].preferences
     project_active = cache.project_active_get()
 
+    _sequence_enum_list.clear()
     if not project_active or not addon_prefs.session.is_auth:
-        return [("None", "None", "")]
-
-    enum_list = [(s.name, s.name, "") for s in project_active.get_sequences_all()]
-    return enum_list
+        _sequence_enum_list.append(("None", "None", ""))
+        return _sequence_enum_list
+
+    # Sequences are already requested for the context's sequence enum, so
+    # build on that list instead of requesting them again.
+    _sequence_enum_list.extend(
+        [
+            (name, name, "")
+            for _, name, _ in cache.get_sequences_enum_list(self, context)
+        ]
+    )
+    return _sequence_enum_list
 
 
 def _gen_shot_preview(self: Any) -> str:
@@ -18,7 +18,7 @@
 #
 # (c) 2021, Blender Foundation - Paul Golter
 
-from typing import Optional
+from typing import Dict, Optional
 
 import bpy
 
@@ -75,21 +75,57 @@ def has_meta(strip: bpy.types.Sequence) -> bool:
     return True
 
 
+def shots_by_id(project: Project) -> Dict[str, Shot]:
+    """
+    Returns all shots of the project by their id, using a single request.
+    Unlike shots requested by id, these don't contain their tasks or the
+    names of their sequence and project. Only use them to check or read shots,
+    not to push a whole shot back to the server.
+    """
+    if not project:
+        return {}
+
+    shots = {}
+    for shot in project.get_shots_all():
+        # The sequence is the shot's parent.
+        shot.sequence_id = shot.sequence_id or shot.parent_id
+        shots[shot.id] = shot
+    return shots
+
+
 def shot_exists_by_id(
-    strip: bpy.types.Sequence, clear_cache: bool = True
+    strip: bpy.types.Sequence,
+    clear_cache: bool = True,
+    shots: Optional[Dict[str, Shot]] = None,
 ) -> Optional[Shot]:
-    """Returns Shot instance if shot with strip.kitsu.shot_id exists else None"""
+    """
+    Returns Shot instance if shot with strip.kitsu.shot_id exists else None.
+    Shots can be looked up in the result of shots_by_id() first, to avoid a
+    request per strip when checking many strips.
+    """
 
     if clear_cache:
         Cache.clear_all()
 
+    shot_id = strip.kitsu.shot_id
+
+    if shots and shot_id in shots:
+        shot = shots[shot_id]
+        logger.info(
+            "Strip: %s Shot %s exists on server (ID: %s)",
+            strip.name,
+            shot.name,
+            shot.id,
+        )
+        return shot
+
     try:
-        shot = Shot.by_id(strip.kitsu.shot_id)
+        shot = Shot.by_id(shot_id)
     except (gazu.exception.RouteNotFoundException, gazu.exception.ServerErrorException):
         logger.info(
             "Strip: %s No shot found on server with ID: %s",
             strip.name,
-            strip.kitsu.shot_id,
+            shot_id,
         )
         return None
 
@@ -36,6 +36,7 @@ from blender_kitsu.types import (
     Sequence,
     Shot,
     TaskType,
+    TaskStatus,
 )
 
 logger = LoggerFactory.getLogger()
@@ -79,6 +80,8 @@ class KITSU_OT_sqe_push_shot_meta(bpy.types.Operator):
         sequence_ids: List[str] = []
 
         # Shots.
+        # Shots are requested one by one, not with checkstrip.shots_by_id(). The
+        # whole shot gets pushed back, which needs the full shot of the server.
         for idx, strip in enumerate(selected_sequences):
             context.window_manager.progress_update(idx)
 
@@ -98,7 +101,16 @@ class KITSU_OT_sqe_push_shot_meta(bpy.types.Operator):
                 continue
 
             # Push update to shot.
-            push.shot_meta(strip, shot)
+            try:
+                push.shot_meta(strip, shot)
+            except (
+                gazu.exception.ServerErrorException,
+                gazu.exception.NotAllowedException,
+                gazu.exception.ParameterException,
+            ):
+                logger.exception("Failed to push meta to shot: %s", shot.name)
+                failed.append(strip)
+                continue
 
             # Append sequence id.
             if shot.parent_id not in sequence_ids:
@@ -159,13 +171,13 @@ class KITSU_OT_sqe_push_new_shot(bpy.types.Operator):
         if nr_of_shots == 1:
             strip = context.scene.sequence_editor.active_strip
             return bool(
-                prefs.session_auth(context)
-                and cache.project_active_get()
+                cache.project_active_get()
+                and prefs.session_auth(context)
                 and strip.kitsu.sequence_name
                 and strip.kitsu.shot_name
             )
 
-        return bool(prefs.session_auth(context) and cache.project_active_get())
+        return bool(cache.project_active_get() and prefs.session_auth(context))
 
     def execute(self, context: bpy.types.Context) -> Set[str]:
 
@@ -321,7 +333,7 @@ class KITSU_OT_sqe_push_new_sequence(bpy.types.Operator):
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
         # Needs to be logged in, active project.
-        return bool(prefs.session_auth(context) and cache.project_active_get())
+        return bool(cache.project_active_get() and prefs.session_auth(context))
 
     def execute(self, context: bpy.types.Context) -> Set[str]:
 
@@ -421,11 +433,12 @@ class KITSU_OT_sqe_init_strip(bpy.types.Operator):
             if not checkstrip.is_valid_type(strip):
                 continue
 
-            if strip.kitsu.initialized:
+            kitsu = strip.kitsu
+            if kitsu.initialized:
                 logger.info("%s already initialized", strip.name)
                 continue
 
-            strip.kitsu.initialized = True
+            kitsu.initialized = True
 
             # Apply strip.kitsu.frame_start_offset.
             opsdata.init_start_frame_offset(strip)
@@ -474,8 +487,8 @@ class KITSU_OT_sqe_link_sequence(bpy.types.Operator):
             return False
         strip = sqe.active_strip
         return bool(
-            prefs.session_auth(context)
-            and cache.project_active_get()
+            cache.project_active_get()
+            and prefs.session_auth(context)
             and strip
             and context.selected_sequences
             and checkstrip.is_valid_type(strip)
@@ -534,8 +547,8 @@ class KITSU_OT_sqe_link_shot(bpy.types.Operator):
             return False
         strip = sqe.active_strip
         return bool(
-            prefs.session_auth(context)
-            and cache.project_active_get()
+            cache.project_active_get()
+            and prefs.session_auth(context)
             and strip
             and context.selected_sequences
             and checkstrip.is_valid_type(strip)
@@ -768,6 +781,12 @@ class KITSU_OT_sqe_pull_shot_meta(bpy.types.Operator):
         sequence_ids: List[str] = []
 
         # Shots.
+        # With many strips, request all shots of the project once instead of
+        # one request per strip.
+        shots = {}
+        if len(selected_sequences) > 1:
+            shots = checkstrip.shots_by_id(cache.project_active_get())
+
         for idx, strip in enumerate(selected_sequences):
             context.window_manager.progress_update(idx)
 
@@ -781,7 +800,7 @@ class KITSU_OT_sqe_pull_shot_meta(bpy.types.Operator):
                 continue
 
             # Check if shot is still available by id.
-            shot = checkstrip.shot_exists_by_id(strip, clear_cache=False)
+            shot = checkstrip.shot_exists_by_id(strip, clear_cache=False, shots=shots)
             if not shot:
                 failed.append(strip)
                 continue
@@ -966,6 +985,12 @@ class KITSU_OT_sqe_push_del_shot(bpy.types.Operator):
 
         context.window_manager.progress_begin(0, len(selected_sequences))
 
+        # With many strips, request all shots of the project once instead of
+        # one request per strip.
+        shots = {}
+        if len(selected_sequences) > 1:
+            shots = checkstrip.shots_by_id(cache.project_active_get())
+
         for idx, strip in enumerate(selected_sequences):
             context.window_manager.progress_update(idx)
 
@@ -977,7 +1002,7 @@ class KITSU_OT_sqe_push_del_shot(bpy.types.Operator):
                 continue
 
             # Check if shot still exists to sevrer.
-            shot = checkstrip.shot_exists_by_id(strip, clear_cache=False)
+            shot = checkstrip.shot_exists_by_id(strip, clear_cache=False, shots=shots)
             if not shot:
                 failed.append(strip)
                 continue
@@ -1041,7 +1066,7 @@ class KITSU_OT_sqe_set_thumbnail_task_type(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
-        return bool(prefs.session_auth(context) and cache.project_active_get())
+        return bool(cache.project_active_get() and prefs.session_auth(context))
 
     def execute(self, context: bpy.types.Context) -> Set[str]:
 
@@ -1078,7 +1103,7 @@ class KITSU_OT_sqe_set_sqe_render_task_type(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
-        return bool(prefs.session_auth(context) and cache.project_active_get())
+        return bool(cache.project_active_get() and prefs.session_auth(context))
 
     def execute(self, context: bpy.types.Context) -> Set[str]:
 
@@ -1121,7 +1146,8 @@ class KITSU_OT_sqe_push_thumbnail(bpy.types.Operator):
         nr_of_strips: int = len(context.selected_sequences)
         do_multishot: bool = nr_of_strips > 1
         failed = []
-        upload_queue: List[Path] = []  # Will be used as succeeded list
+        # Shot and thumbnail path, will be used as succeeded list.
+        upload_queue: List[Tuple[Shot, Path]] = []
         # Get task type by id from user selection enum property.
         task_type = TaskType.by_id(context.scene.kitsu.task_type_thumbnail_id)
 
@@ -1130,6 +1156,11 @@ class KITSU_OT_sqe_push_thumbnail(bpy.types.Operator):
         # Clear cache.
         Cache.clear_all()
 
+        # Ensure folder exists, once for all thumbnails.
+        addon_prefs = prefs.addon_prefs_get(context)
+        folder_path = Path(addon_prefs.thumbnail_dir).absolute()
+        folder_path.mkdir(parents=True, exist_ok=True)
+
         with self.override_render_settings(context):
             with self.temporary_current_frame(context) as original_curframe:
 
@@ -1147,6 +1178,12 @@ class KITSU_OT_sqe_push_thumbnail(bpy.types.Operator):
 
                 context.window_manager.progress_begin(0, len(selected_sequences))
 
+                # With many strips, request all shots of the project once instead of
+                # one request per strip.
+                shots = {}
+                if len(selected_sequences) > 1:
+                    shots = checkstrip.shots_by_id(cache.project_active_get())
+
                 for idx, strip in enumerate(selected_sequences):
                     context.window_manager.progress_update(idx)
 
@@ -1160,7 +1197,9 @@ class KITSU_OT_sqe_push_thumbnail(bpy.types.Operator):
                         continue
 
                     # Check if shot is still available by id.
-                    shot = checkstrip.shot_exists_by_id(strip, clear_cache=False)
+                    shot = checkstrip.shot_exists_by_id(
+                        strip, clear_cache=False, shots=shots
+                    )
                     if not shot:
                         failed.append(strip)
                         continue
@@ -1174,8 +1213,8 @@ class KITSU_OT_sqe_push_thumbnail(bpy.types.Operator):
                     else:
                         self.set_middle_frame(context, strip)
 
-                    path = self.make_thumbnail(context, strip)
-                    upload_queue.append(path)
+                    path = self.make_thumbnail(context, strip, folder_path)
+                    upload_queue.append((shot, path))
 
                 # End first progress update.
                 context.window_manager.progress_update(len(upload_queue))
@@ -1186,11 +1225,22 @@ class KITSU_OT_sqe_push_thumbnail(bpy.types.Operator):
         # Begin second progress update.
         context.window_manager.progress_begin(0, len(upload_queue))
 
-        # Process thumbnail queue.
-        for idx, filepath in enumerate(upload_queue):
+        # Same for every shot, so only get it once.
+        task_status_wip = TaskStatus.by_short_name("wip")
+
+        # Process thumbnail queue in order, so with multiple strips of the same
+        # shot the last one ends up as its main preview. Gazu's client is not
+        # thread safe, so the uploads are not sent at the same time.
+        for idx, (shot, filepath) in enumerate(upload_queue):
             context.window_manager.progress_update(idx)
-            opsdata.upload_preview(
-                context, filepath, task_type, comment="Update thumbnail"
+            task, task_status = opsdata.get_preview_task(
+                shot, task_type, task_status_wip
+            )
+            opsdata.upload_preview_to_task(
+                task, task_status, filepath, comment="Update thumbnail"
+            )
+            logger.info(
+                "Uploaded preview for shot: %s under: %s", shot.name, task_type.name
             )
 
         # End second progress update.
@@ -1214,25 +1264,24 @@ class KITSU_OT_sqe_push_thumbnail(bpy.types.Operator):
         return {"FINISHED"}
 
     def make_thumbnail(
-        self, context: bpy.types.Context, strip: bpy.types.Sequence
+        self, context: bpy.types.Context, strip: bpy.types.Sequence, folder_path: Path
     ) -> Path:
-        bpy.ops.render.render()
+        # A viewport render of the sequencer is enough for a thumbnail and
+        # much faster than a full render of the scene.
+        bpy.ops.render.opengl(sequencer=True)
         file_name = f"{strip.kitsu.shot_id}_{str(context.scene.frame_current)}.jpg"
-        path = self._save_render(bpy.data.images["Render Result"], file_name)
+        path = self._save_render(
+            bpy.data.images["Render Result"], folder_path, file_name
+        )
         logger.info(
-            f"Saved thumbnail of shot {strip.kitsu.shot_name} to {path.as_posix()}"
+            "Saved thumbnail of shot %s to %s", strip.kitsu.shot_name, path.as_posix()
         )
         return path
 
-    def _save_render(self, datablock: bpy.types.Image, file_name: str) -> Path:
-        """Save the current render image to disk"""
-
-        addon_prefs = prefs.addon_prefs_get(bpy.context)
-        folder_name = addon_prefs.thumbnail_dir
-
-        # Ensure folder exists.
-        folder_path = Path(folder_name).absolute()
-        folder_path.mkdir(parents=True, exist_ok=True)
+    def _save_render(
+        self, datablock: bpy.types.Image, folder_path: Path, file_name: str
+    ) -> Path:
+        """Save the current render image to disk, folder_path has to exist"""
 
         path = folder_path.joinpath(file_name)
         datablock.save_render(str(path))
@@ -1307,7 +1356,8 @@ class KITSU_OT_sqe_push_render(bpy.types.Operator):
 
     def execute(self, context: bpy.types.Context) -> Set[str]:
         failed = []
-        upload_queue: List[Path] = []  # will be used as successed list
+        # Shot and render path, will be used as successed list.
+        upload_queue: List[Tuple[Shot, Path]] = []
         # Get task stype by id from user selection enum property.
         task_type = TaskType.by_id(context.scene.kitsu.task_type_sqe_render_id)
 
@@ -1316,6 +1366,11 @@ class KITSU_OT_sqe_push_render(bpy.types.Operator):
         # Clear cache.
         Cache.clear_all()
 
+        # Ensure folder exists, once for all renders.
+        addon_prefs = prefs.addon_prefs_get(context)
+        folder_path = Path(addon_prefs.sqe_render_dir).absolute()
+        folder_path.mkdir(parents=True, exist_ok=True)
+
         with self.override_render_settings(context):
 
             # ----RENDER AND SAVE SQE ------.
@@ -1333,6 +1388,12 @@ class KITSU_OT_sqe_push_render(bpy.types.Operator):
             # Begin first progress update.
             context.window_manager.progress_begin(0, len(selected_sequences))
 
+            # With many strips, request all shots of the project once instead of
+            # one request per strip.
+            shots = {}
+            if len(selected_sequences) > 1:
+                shots = checkstrip.shots_by_id(cache.project_active_get())
+
             for idx, strip in enumerate(selected_sequences):
                 context.window_manager.progress_update(idx)
 
@@ -1344,27 +1405,26 @@ class KITSU_OT_sqe_push_render(bpy.types.Operator):
                     continue
 
                 # Check if shot is still available by id.
-                shot = checkstrip.shot_exists_by_id(strip, clear_cache=False)
+                shot = checkstrip.shot_exists_by_id(
+                    strip, clear_cache=False, shots=shots
+                )
                 if not shot:
                     failed.append(strip)
                     continue
 
                 # Output path.
-                output_path = self._gen_output_path(strip, task_type)
+                output_path = self._gen_output_path(strip, task_type, folder_path)
                 context.scene.render.filepath = output_path.as_posix()
 
                 # Frame range.
                 context.scene.frame_start = strip.frame_final_start
                 context.scene.frame_end = strip.frame_final_end - 1
 
-                # Ensure folder exists.
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
                 # Make opengl render.
                 bpy.ops.render.opengl(animation=True, sequencer=True)
 
                 # Append path to upload queue.
-                upload_queue.append(output_path)
+                upload_queue.append((shot, output_path))
 
             # End first progress update.
             context.window_manager.progress_update(len(upload_queue))
@@ -1376,10 +1436,14 @@ class KITSU_OT_sqe_push_render(bpy.types.Operator):
         context.window_manager.progress_begin(0, len(upload_queue))
 
         # Process thumbnail queue.
-        for idx, filepath in enumerate(upload_queue):
+        for idx, (shot, filepath) in enumerate(upload_queue):
             context.window_manager.progress_update(idx)
             opsdata.upload_preview(
-                context, filepath, task_type, comment="Sequence Editor Render"
+                context,
+                filepath,
+                task_type,
+                comment="Sequence Editor Render",
+                shot=shot,
             )
 
         # End second progress update.
@@ -1402,11 +1466,11 @@ class KITSU_OT_sqe_push_render(bpy.types.Operator):
         logger.info("-END- Pushing Sequence Editor Render")
         return {"FINISHED"}
 
-    def _gen_output_path(self, strip: bpy.types.Sequence, task_type: TaskType) -> Path:
-        addon_prefs = prefs.addon_prefs_get(bpy.context)
-        folder_name = addon_prefs.sqe_render_dir
+    def _gen_output_path(
+        self, strip: bpy.types.Sequence, task_type: TaskType, folder_path: Path
+    ) -> Path:
         file_name = f"{strip.kitsu.shot_id}_{strip.kitsu.shot_name}.{(task_type.name).lower()}.mp4"
-        return Path(folder_name).absolute().joinpath(file_name)
+        return folder_path.joinpath(file_name)
 
     @contextlib.contextmanager
     def override_render_settings(self, context, thumbnail_width=256):
@@ -1595,8 +1659,8 @@ class KITSU_OT_sqe_pull_edit(bpy.types.Operator):
     def poll(cls, context: bpy.types.Context) -> bool:
         addon_prefs = prefs.addon_prefs_get(context)
         return bool(
-            prefs.session_auth(context)
-            and cache.project_active_get()
+            cache.project_active_get()
+            and prefs.session_auth(context)
             and addon_prefs.metastrip_file
         )
 
@@ -24,12 +24,16 @@ from typing import Any, Dict, List, Tuple, Union, Optional
 
 import bpy
 
+from blender_kitsu import cache
 from blender_kitsu.logger import LoggerFactory
 from blender_kitsu.types import Sequence, Task, TaskStatus, Shot, TaskType
 
 logger = LoggerFactory.getLogger()
 
 _sqe_shot_enum_list: List[Tuple[str, str, str]] = []
+# The debug operators fill these lists once in invoke() with the sqe_update_*
+# functions. The enum items callbacks only return them, as they run on every
+# redraw of the popup. Keeping the lists here also keeps the item strings alive.
 _sqe_not_linked: List[Tuple[str, str, str]] = []
 _sqe_duplicates: List[Tuple[str, str, str]] = []
 _sqe_multi_project: List[Tuple[str, str, str]] = []
@@ -47,17 +51,27 @@ def sqe_get_multi_project(self, context):
     return _sqe_multi_project
 
 
+def _get_strips_to_check(context: bpy.types.Context) -> List[bpy.types.Sequence]:
+    """get selected strips or all strips if none are selected"""
+    strips = context.selected_sequences
+    if strips:
+        return strips
+
+    sqe = context.scene.sequence_editor
+    if not sqe:
+        return []
+    return list(sqe.sequences_all)
+
+
 def sqe_update_not_linked(context: bpy.types.Context) -> List[Tuple[str, str, str]]:
     """get all strips that are initialized but not linked yet"""
     enum_list = []
 
-    if context.selected_sequences:
-        strips = context.selected_sequences
-    else:
-        strips = context.scene.sequence_editor.sequences_all
+    strips = _get_strips_to_check(context)
 
     for strip in strips:
-        if strip.kitsu.initialized and not strip.kitsu.linked:
+        kitsu = strip.kitsu
+        if kitsu.initialized and not kitsu.linked:
             enum_list.append((strip.name, strip.name, ""))
 
     return enum_list
@@ -67,29 +81,21 @@ def sqe_update_duplicates(context: bpy.types.Context) -> List[Tuple[str, str, st
     """get all strips that are initialized but not linked yet"""
     enum_list = []
     data_dict = {}
-    if context.selected_sequences:
-        strips = context.selected_sequences
-    else:
-        strips = context.scene.sequence_editor.sequences_all
+    strips = _get_strips_to_check(context)
 
     # Create data dict that holds all shots ids and the corresponding strips that are linked to it.
-    for i in range(len(strips)):
-
-        if strips[i].kitsu.linked:
-            # Get shot_id, shot_name, create entry in data_dict if id not existent.
-            shot_id = strips[i].kitsu.shot_id
-            shot_name = strips[i].kitsu.shot_name
-            if shot_id not in data_dict:
-                data_dict[shot_id] = {"name": shot_name, "strips": []}
-
-            # Append i to strips list.
-            if strips[i] not in set(data_dict[shot_id]["strips"]):
-                data_dict[shot_id]["strips"].append(strips[i])
-
-            # Comparet to all other strip.
-            for j in range(i + 1, len(strips)):
-                if shot_id == strips[j].kitsu.shot_id:
-                    data_dict[shot_id]["strips"].append(strips[j])
+    for strip in strips:
+        kitsu = strip.kitsu
+        if not kitsu.linked:
+            continue
+
+        # Get shot_id, create entry with shot_name in data_dict if id not existent.
+        shot_id = kitsu.shot_id
+        entry = data_dict.get(shot_id)
+        if entry is None:
+            data_dict[shot_id] = {"name": kitsu.shot_name, "strips": [strip]}
+        else:
+            entry["strips"].append(strip)
 
     # Convert in data strucutre for enum property.
     for shot_id, data in data_dict.items():
@@ -106,10 +112,7 @@ def sqe_update_multi_project(context: bpy.types.Context) -> List[Tuple[str, str,
     enum_list: List[Tuple[str, str, str]] = []
     data_dict: Dict[str, Any] = {}
 
-    if context.selected_sequences:
-        strips = context.selected_sequences
-    else:
-        strips = context.scene.sequence_editor.sequences_all
+    strips = _get_strips_to_check(context)
 
     # Create data dict that holds project names as key and values the corresponding sequence strips.
     for strip in strips:
@@ -160,33 +163,48 @@ def get_shots_enum_for_link_shot_op(
     if not self.sequence_enum:
         return []
 
-    zseq_active = Sequence.by_id(self.sequence_enum)
+    if cache.enum_list_is_valid("sqe_link_shots", self.sequence_enum):
+        return _sqe_shot_enum_list
+
+    # The sequence enum of this operator was just built from the same
+    # sequences, so this usually doesn't need a request.
+    zseq_active = cache.entity_by_id(Sequence, self.sequence_enum)
 
     _sqe_shot_enum_list.clear()
     _sqe_shot_enum_list.extend(
         [(s.id, s.name, s.description or "") for s in zseq_active.get_all_shots()]
     )
+    cache.enum_list_set_valid("sqe_link_shots", self.sequence_enum)
     return _sqe_shot_enum_list
 
 
-def upload_preview(
-    context: bpy.types.Context, filepath: Path, task_type: TaskType, comment: str = ""
-) -> None:
-    # Get shot by id which is in filename of thumbnail.
-    shot_id = filepath.name.split("_")[0]
-    shot = Shot.by_id(shot_id)
-
+def get_preview_task(
+    shot: Shot, task_type: TaskType, task_status_wip: Optional[TaskStatus] = None
+) -> Tuple[Task, TaskStatus]:
+    """
+    Get the task of the shot that a preview should be uploaded to and its status.
+    Creates the task with status wip, if it does not exist yet.
+    """
     # Find task from task type for that shot, ca be None of no task was added for that task type.
     task = Task.by_name(shot, task_type)
 
     if not task:
         # Turns out a entity on the server can have 0 tasks even tough task types exist
         # you have to create a task first before being able to upload a thumbnail.
-        task_status = TaskStatus.by_short_name("wip")
+        task_status = task_status_wip or TaskStatus.by_short_name("wip")
         task = Task.new_task(shot, task_type, task_status=task_status)
     else:
         task_status = TaskStatus.by_id(task.task_status_id)
 
+    return task, task_status
+
+
+def upload_preview_to_task(
+    task: Task, task_status: TaskStatus, filepath: Path, comment: str = ""
+) -> None:
+    """
+    Add a comment with the preview file to the task and make it the main preview.
+    """
     # Create a comment, e.G 'Update thumbnail'.
     comment_obj = task.add_comment(task_status, comment=comment)
 
@@ -195,7 +213,23 @@ def upload_preview(
 
     # Preview.set_main_preview().
     preview.set_main_preview()
-    logger.info(f"Uploaded preview for shot: {shot.name} under: {task_type.name}")
+
+
+def upload_preview(
+    context: bpy.types.Context,
+    filepath: Path,
+    task_type: TaskType,
+    comment: str = "",
+    shot: Optional[Shot] = None,
+) -> None:
+    if not shot:
+        # Get shot by id which is in filename of thumbnail.
+        shot_id = filepath.name.split("_")[0]
+        shot = Shot.by_id(shot_id)
+
+    task, task_status = get_preview_task(shot, task_type)
+    upload_preview_to_task(task, task_status, filepath, comment=comment)
+    logger.info("Uploaded preview for shot: %s under: %s", shot.name, task_type.name)
 
 
 def init_start_frame_offset(strip: bpy.types.Sequence) -> None:
@@ -20,7 +20,7 @@
 
 import bpy
 
-from blender_kitsu import bkglobals
+from blender_kitsu import bkglobals, cache
 from blender_kitsu.types import Cache, Sequence, Project, Shot
 from blender_kitsu.logger import LoggerFactory
 
@@ -33,24 +33,38 @@ def shot_meta(strip: bpy.types.Sequence, shot: Shot, clear_cache: bool = True) -
         # Clear cache before pulling.
         Cache.clear_all()
 
+    kitsu = strip.kitsu
+
     # Update sequence props.
-    seq = Sequence.by_id(shot.parent_id)
-    strip.kitsu.sequence_id = seq.id
-    strip.kitsu.sequence_name = seq.name
+    # Shots requested by id already contain the name of their sequence and project.
+    if shot.sequence_name:
+        kitsu.sequence_id = shot.parent_id
+        kitsu.sequence_name = shot.sequence_name
+    else:
+        seq = Sequence.by_id(shot.parent_id)
+        kitsu.sequence_id = seq.id
+        kitsu.sequence_name = seq.name
 
     # Update shot props.
-    strip.kitsu.shot_id = shot.id
-    strip.kitsu.shot_name = shot.name
-    strip.kitsu.shot_description = shot.description if shot.description else ""
+    kitsu.shot_id = shot.id
+    kitsu.shot_name = shot.name
+    kitsu.shot_description = shot.description if shot.description else ""
 
     # Update project props.
-    project = Project.by_id(shot.project_id)
-    strip.kitsu.project_id = project.id
-    strip.kitsu.project_name = project.name
+    if shot.project_name:
+        kitsu.project_id = shot.project_id
+        kitsu.project_name = shot.project_name
+    else:
+        # Usually the shot is in the active project, which is cached.
+        project = cache.project_active_get()
+        if project.id != shot.project_id:
+            project = Project.by_id(shot.project_id)
+        kitsu.project_id = project.id
+        kitsu.project_name = project.name
 
     # Update meta props.
-    strip.kitsu.initialized = True
-    strip.kitsu.linked = True
+    kitsu.initialized = True
+    kitsu.linked = True
 
     # Update strip name.
     strip.name = shot.name
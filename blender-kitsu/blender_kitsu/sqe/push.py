@@ -31,9 +31,11 @@ logger = LoggerFactory.getLogger()
 
 def shot_meta(strip: bpy.types.Sequence, shot: Shot) -> None:
 
+    kitsu = strip.kitsu
+
     # Update shot info.
-    shot.name = strip.kitsu.shot_name
-    shot.description = strip.kitsu.shot_description
+    shot.name = kitsu.shot_name
+    shot.description = kitsu.shot_description
     shot.data["frame_in"] = strip.frame_final_start
     shot.data["frame_out"] = strip.frame_final_end
     shot.data["3d_in"] = strip.kitsu_frame_start
@@ -43,8 +45,8 @@ def shot_meta(strip: bpy.types.Sequence, shot: Shot) -> None:
 
     # If user changed the sequence the shot belongs to
     # (can only be done by operator not by hand).
-    if strip.kitsu.sequence_id != shot.sequence_id:
-        sequence = Sequence.by_id(strip.kitsu.sequence_id)
+    if kitsu.sequence_id != shot.sequence_id:
+        sequence = Sequence.by_id(kitsu.sequence_id)
         shot.sequence_id = sequence.id
         shot.parent_id = sequence.id
         shot.sequence_name = sequence.name
@@ -30,6 +30,10 @@ logger = LoggerFactory.getLogger()
 
 D = TypeVar("D", bound="BaseDataClass")
 
+# Parameter names of each dataclass, so from_dict() doesn't have to inspect the
+# class signature again for every key of every entity it creates.
+_parameter_names_cache: Dict[type, frozenset] = {}
+
 
 class Session:
 
@@ -51,7 +55,7 @@ class Session:
     def start(self) -> SessionData:
         # Clear all data.
         gazu.cache.disable()
-        gazu.cache.clear_all()
+        Cache.clear_all()
 
         # Enable cache.
         gazu.cache.enable()
@@ -70,7 +74,7 @@ class Session:
             return False
 
         self._data = SessionData(gazu.log_out())  # returns empty dict
-        gazu.cache.clear_all()
+        Cache.clear_all()
         logger.info("Session ended")
         return True
 
@@ -174,10 +178,15 @@ class BaseDataClass:
         # of the Kitsu API.
         valid_key_values = {}
 
+        parameter_names = _parameter_names_cache.get(cls)
+        if parameter_names is None:
+            parameter_names = frozenset(inspect.signature(cls).parameters)
+            _parameter_names_cache[cls] = parameter_names
+
         # At least keep track of unexpected arguments and log them.
         unexpected_args: List[str] = []
         for k, v in env.items():
-            if k not in inspect.signature(cls).parameters:
+            if k not in parameter_names:
                 unexpected_args.append(f"{k}:{type(v).__name__}={str(v)}")
                 continue
             valid_key_values[k] = v
@@ -304,14 +313,13 @@ class Project(Entity):
 
     def get_sequences_all(self) -> List[Sequence]:
         sequences = [
-            Sequence.from_dict(s)
-            for s in gazu.shot.all_sequences_for_project(asdict(self))
+            Sequence.from_dict(s) for s in gazu.shot.all_sequences_for_project(self.id)
         ]
         return sorted(sequences, key=lambda x: x.name)
 
     def create_sequence(self, sequence_name: str) -> Sequence:
         # This function returns a seq dict even if seq already exists, it does not override.
-        seq_dict = gazu.shot.new_sequence(asdict(self), sequence_name, episode=None)
+        seq_dict = gazu.shot.new_sequence(self.id, sequence_name, episode=None)
         return Sequence.from_dict(seq_dict)
 
     # SHOT
@@ -321,9 +329,7 @@ class Project(Entity):
         return Shot.by_id(shot_id)
 
     def get_shots_all(self) -> List[Shot]:
-        shots = [
-            Shot.from_dict(s) for s in gazu.shot.all_shots_for_project(asdict(self))
-        ]
+        shots = [Shot.from_dict(s) for s in gazu.shot.all_shots_for_project(self.id)]
         return sorted(shots, key=lambda x: x.name)
 
     def get_shot_by_name(self, sequence: Sequence, name: str) -> Optional[Shot]:
@@ -340,8 +346,8 @@ class Project(Entity):
     ) -> Shot:
         # This function returns a shot dict even if shot already exists, it does not override.
         shot_dict = gazu.shot.new_shot(
-            asdict(self),
-            asdict(sequence),
+            self.id,
+            sequence.id,
             shot_name,
             nb_frames,
             frame_in=frame_in,
@@ -371,7 +377,7 @@ class Project(Entity):
 
     def get_all_assets(self) -> List[Asset]:
         assets = [
-            Asset.from_dict(a) for a in gazu.asset.all_assets_for_project(asdict(self))
+            Asset.from_dict(a) for a in gazu.asset.all_assets_for_project(self.id)
         ]
         return sorted(assets, key=lambda x: x.name)
 
@@ -381,9 +387,7 @@ class Project(Entity):
     def get_all_assets_for_type(self, assettype: AssetType) -> List[Asset]:
         assets = [
             Asset.from_dict(a)
-            for a in gazu.asset.all_assets_for_project_and_type(
-                asdict(self), asdict(assettype)
-            )
+            for a in gazu.asset.all_assets_for_project_and_type(self.id, assettype.id)
         ]
         return sorted(assets, key=lambda x: x.name)
 
@@ -441,21 +445,18 @@ class Sequence(Entity):
 
     def get_all_shots(self) -> List[Shot]:
         shots = [
-            Shot.from_dict(shot)
-            for shot in gazu.shot.all_shots_for_sequence(asdict(self))
+            Shot.from_dict(shot) for shot in gazu.shot.all_shots_for_sequence(self.id)
         ]
         return sorted(shots, key=lambda x: x.name)
 
     def get_all_task_types(self) -> List[TaskType]:
         return [
             TaskType.from_dict(t)
-            for t in gazu.task.all_task_types_for_sequence(asdict(self))
+            for t in gazu.task.all_task_types_for_sequence(self.id)
         ]
 
     def get_all_tasks(self) -> List[Task]:
-        return [
-            Task.from_dict(t) for t in gazu.task.all_tasks_for_sequence(asdict(self))
-        ]
+        return [Task.from_dict(t) for t in gazu.task.all_tasks_for_sequence(self.id)]
 
     def update(self) -> Sequence:
         gazu.shot.update_sequence(asdict(self))
@@ -539,7 +540,7 @@ class Shot(Entity):
     @classmethod
     def by_name(cls, sequence: Sequence, shot_name: str) -> Optional[Shot]:
         # Can return None if shot does not exist.
-        shot_dict = gazu.shot.get_shot_by_name(asdict(sequence), shot_name)
+        shot_dict = gazu.shot.get_shot_by_name(sequence.id, shot_name)
         if shot_dict:
             return cls.from_dict(shot_dict)
         return None
@@ -551,12 +552,11 @@ class Shot(Entity):
 
     def get_all_task_types(self) -> List[TaskType]:
         return [
-            TaskType.from_dict(t)
-            for t in gazu.task.all_task_types_for_shot(asdict(self))
+            TaskType.from_dict(t) for t in gazu.task.all_task_types_for_shot(self.id)
         ]
 
     def get_all_tasks(self) -> List[Task]:
-        return [Task.from_dict(t) for t in gazu.task.all_tasks_for_shot(asdict(self))]
+        return [Task.from_dict(t) for t in gazu.task.all_tasks_for_shot(self.id)]
 
     def get_sequence(self) -> Sequence:
         return Sequence.from_dict(gazu.shot.get_sequence_from_shot(asdict(self)))
@@ -639,12 +639,11 @@ class Asset(Entity):
 
     def get_all_task_types(self) -> List[TaskType]:
         return [
-            TaskType.from_dict(t)
-            for t in gazu.task.all_task_types_for_asset(asdict(self))
+            TaskType.from_dict(t) for t in gazu.task.all_task_types_for_asset(self.id)
         ]
 
     def get_all_tasks(self) -> List[Task]:
-        return [Task.from_dict(t) for t in gazu.task.all_tasks_for_asset(asdict(self))]
+        return [Task.from_dict(t) for t in gazu.task.all_tasks_for_asset(self.id)]
 
     def __bool__(self) -> bool:
         return bool(self.id)
@@ -778,12 +777,8 @@ class Task(Entity):
         name: str = "main",
     ) -> Optional[Task]:
 
-        # Convert args to dict for api call.
-        asset_shotdict = asdict(asset_shot)
-        task_type_dict = asdict(task_type)
-
         # Can return None if task does not exist.
-        task_dict = gazu.task.get_task_by_name(asset_shotdict, task_type_dict, name)
+        task_dict = gazu.task.get_task_by_name(asset_shot.id, task_type.id, name)
 
         if task_dict:
             return cls.from_dict(task_dict)
@@ -1160,7 +1155,12 @@ class Person(Entity):
 
 
 class Cache:
+    # Incremented whenever the server cache is cleared, so data that is cached
+    # on top of it (like enum lists) knows it needs to be rebuilt.
+    generation: int = 0
+
     @classmethod
     def clear_all(cls):
+        cls.generation += 1
         logger.debug("Cleared Server Cache")
         return gazu.cache.clear_all()
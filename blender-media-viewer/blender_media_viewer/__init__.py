@@ -34,6 +34,32 @@ def draw_left_override(self, context: bpy.types.Context):
     bpy.types.TOPBAR_MT_editor_menus.draw_collapsible(context, layout)
 
 
+def draw_noop(self, context: bpy.types.Context):
+    return None
+
+
+# Original draw functions that were overridden, so they can be restored.
+# Key: (class name, attribute name), Value: original function.
+saved_draws: Dict[tuple, Any] = {}
+
+
+def override_draw(cls: Any, attr: str, func: Any) -> None:
+    key = (cls.__name__, attr)
+    # Only save the very first original, which prevents saving our own
+    # overrides if this runs multiple times.
+    if key not in saved_draws:
+        saved_draws[key] = getattr(cls, attr)
+    setattr(cls, attr, func)
+
+
+def restore_draws() -> None:
+    for (cls_name, attr), func in saved_draws.items():
+        cls = getattr(bpy.types, cls_name, None)
+        if cls:
+            setattr(cls, attr, func)
+    saved_draws.clear()
+
+
 class AppStateStore(AppOverrideState):
     # Just provides data & callbacks for AppOverrideState
     __slots__ = ()
@@ -58,18 +84,18 @@ class AppStateStore(AppOverrideState):
         # Overrides draw function of header to just return None
         # That way we clear all these header globally and can replace
         # them with our custom draw function
-        bpy.types.STATUSBAR_HT_header.draw = lambda self, context: None
-        bpy.types.IMAGE_HT_header.draw = lambda self, context: None
-        bpy.types.SEQUENCER_HT_header.draw = lambda self, context: None
-        bpy.types.TEXT_HT_header.draw = lambda self, context: None
+        override_draw(bpy.types.STATUSBAR_HT_header, "draw", draw_noop)
+        override_draw(bpy.types.IMAGE_HT_header, "draw", draw_noop)
+        override_draw(bpy.types.SEQUENCER_HT_header, "draw", draw_noop)
+        override_draw(bpy.types.TEXT_HT_header, "draw", draw_noop)
 
         # TOPBAR_HT_upper_bar.draw calls draw_left and draw_right
         # we will override those individually. We don't need draw_right anymore.
         # But for draw_left we only want it to draw TOPBAR_MT_editor_menus.draw, which is
         # why we override it with draw_left_override.
-        bpy.types.TOPBAR_HT_upper_bar.draw_left = draw_left_override
-        bpy.types.TOPBAR_HT_upper_bar.draw_right = lambda self, context: None
-        bpy.types.TOPBAR_MT_editor_menus.draw = lambda self, context: None
+        override_draw(bpy.types.TOPBAR_HT_upper_bar, "draw_left", draw_left_override)
+        override_draw(bpy.types.TOPBAR_HT_upper_bar, "draw_right", draw_noop)
+        override_draw(bpy.types.TOPBAR_MT_editor_menus, "draw", draw_noop)
         return classes
 
     # ----------------
@@ -142,12 +168,14 @@ def register():
     app_state.setup()
 
     # Handler.
-    bpy.app.handlers.load_post.append(handler_load_recent_directory)
-    bpy.app.handlers.load_post.append(handler_set_template_defaults)
+    # Only append if not registered yet, to not run them multiple times on reload.
     active_load_post_handlers[:] = (
         handler_load_recent_directory,
         handler_set_template_defaults,
     )
+    for handler in active_load_post_handlers:
+        if handler not in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.append(handler)
 
     # Check if blender-media-viewer was started from commandline with filepaths
     # after '--'.
@@ -173,14 +201,17 @@ def register():
 
         if filepaths:
             init_filepaths.extend(filepaths)
-            bpy.app.handlers.load_post.append(init_with_mediapaths)
+            if init_with_mediapaths not in bpy.app.handlers.load_post:
+                bpy.app.handlers.load_post.append(init_with_mediapaths)
             active_load_post_handlers.append(init_with_mediapaths)
 
 
 def unregister():
     print("Template Unregister", __file__)
     app_state.teardown()
+    restore_draws()
 
     # Handler.
     for handler in reversed(active_load_post_handlers):
-        bpy.app.handlers.load_post.remove(handler)
+        if handler in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(handler)
@@ -14,14 +14,18 @@ from typing import (
 from enum import Enum
 from copy import copy
 
+import numpy as np
+
 import bpy
 import gpu
-import bgl
 import blf
 from gpu_extras.batch import batch_for_shader
 from bpy.app.handlers import persistent
 
 from . import ops, opsdata
+from .log import LoggerFactory
+
+logger = LoggerFactory.getLogger(name=__name__)
 
 Float2 = Tuple[float, float]
 Float3 = Tuple[float, float, float]
@@ -64,17 +68,48 @@ Int4 = Tuple[int, int, int, int]
 
 
 def get_region_by_name(area: bpy.types.Area, name: str) -> Optional[bpy.types.Region]:
-    for region in area.regions:
-        if region.type == name:
-            return region
-    return None
+    return opsdata.get_region_of_area(area, name)
 
 
 REGION_NAME = "PREVIEW"
 REGION_NAME_IMG = "WINDOW"
 
 
+# Geometry of the toggle is constant and only translated by region height.
+# Top left, top right, bot left, bot right.
+_TOGGLE_WIDTH = 30
+_TOGGLE_HEIGHT = 30
+_RECT_TEMPLATE = np.array(
+    [
+        [0, 0],
+        [_TOGGLE_WIDTH, 0],
+        [0, -_TOGGLE_HEIGHT],
+        [_TOGGLE_WIDTH, -_TOGGLE_HEIGHT],
+    ],
+    dtype=np.float32,
+)
+_RECT_IDX = np.array([[0, 1, 2], [2, 1, 3]], dtype=np.uint32)
+
+_toggle_shader: Optional[gpu.types.GPUShader] = None
+_toggle_batch: Optional[gpu.types.GPUBatch] = None
+
+
+def _get_toggle_shader() -> gpu.types.GPUShader:
+    # Builtin shader lookup only needs to happen once.
+    global _toggle_shader
+    if not _toggle_shader:
+        _toggle_shader = gpu.shader.from_builtin("2D_UNIFORM_COLOR")
+    return _toggle_shader
+
+
+def is_header_toggle_enabled() -> bool:
+    return bpy.context.window_manager.media_viewer.draw_header_toggle
+
+
 def draw_toggle(region_name: str):
+    if not is_header_toggle_enabled():
+        return
+
     area = bpy.context.area
 
     region = get_region_by_name(area, region_name)
@@ -83,42 +118,53 @@ def draw_toggle(region_name: str):
 
     offset_y = -5
     offset_x = 10
-    width = 30
-    height = 30
-    # print(f"X: {region.x} Y: {region.y} WIDTH: {region.width} HEIGHT: {region.height}")
+    shader = _get_toggle_shader()
+
+    # Geometry is uploaded once relative to the top left of the region.
+    # Per draw only the translation to the region height changes.
+    global _toggle_batch
+    if not _toggle_batch:
+        offset = np.array([offset_x, offset_y], dtype=np.float32)
+        # Pass contiguous float32 buffer, batch_for_shader supports the buffer protocol.
+        coordinates = _RECT_TEMPLATE + offset
+        _toggle_batch = batch_for_shader(
+            shader,
+            "TRIS",
+            {"pos": coordinates},
+            indices=_RECT_IDX,
+        )
 
-    top_left = (0 + offset_x, region.height + offset_y)
+    with gpu.matrix.push_pop():
+        gpu.matrix.translate((0, region.height))
+        _toggle_batch.draw(shader)
 
-    top_right = (top_left[0] + width, top_left[1])
-    bot_left = (top_left[0], top_left[1] - height)
-    bot_right = (top_left[0] + width, top_left[1] - height)
 
-    coordinates = [top_left, top_right, bot_left, bot_right]
-    shader = gpu.shader.from_builtin("2D_UNIFORM_COLOR")
-    batch = batch_for_shader(
-        shader,
-        "TRIS",
-        {"pos": coordinates},
-        indices=((0, 1, 2), (2, 1, 3)),  # (2, 1, 3)
-    )
-    batch.draw(shader)
+# Font id 0 is the default font that is shared with all of Blender's UI drawing,
+# which changes its size and color in between our draw calls. That's why these
+# have to be set on every draw and can't be skipped if they didn't change.
+_TEXT_FONT_ID = 0
+_TEXT_SIZE = (12, 72)
+_TEXT_COLOR = (1, 1, 1, 0.9)
 
 
 def draw_text(region_name: str):
+    if not is_header_toggle_enabled():
+        return
+
     area = bpy.context.area
     region = get_region_by_name(area, region_name)
 
     offset_y = -20
     offset_x = 5
-    # print(f"X: {region.x} Y: {region.y} WIDTH: {region.width} HEIGHT: {region.height}")
     y = region.height + offset_y
     x = 0 + offset_x
-    font_id = 0
-    bgl.glEnable(bgl.GL_BLEND)
+    font_id = _TEXT_FONT_ID
+    gpu.state.blend_set("ALPHA")
     blf.position(font_id, x, y, 0)
-    blf.size(font_id, 12, 72)
-    blf.color(font_id, 1, 1, 1, 0.9)
+    blf.size(font_id, *_TEXT_SIZE)
+    blf.color(font_id, *_TEXT_COLOR)
     blf.draw(font_id, "Test")
+    gpu.state.blend_set("NONE")
 
 
 # This function is copied from: "https://github.com/ubisoft/videotracks"
@@ -151,10 +197,7 @@ def is_mouse_in_region(region: bpy.types.Region, x: int, y: int) -> bool:
 def get_region_of_area(
     area: bpy.types.Area, region_type: str
 ) -> Optional[bpy.types.Region]:
-    for region in area.regions:
-        if region.type == region_type:
-            return region
-    return None
+    return opsdata.get_region_of_area(area, region_type)
 
 
 def points_to_int2(points: Iterable[Point]) -> Tuple[Int2]:
@@ -380,6 +423,13 @@ class ButtonDrawer:
         self.draw_rect = False
         self._arrow_direction = "UP"
 
+        # Cache batches so they are only rebuilt if arrow direction changes,
+        # not on every redraw. They are in local button coordinates and
+        # translated to the top of the region on draw.
+        self._batch_key: Optional[str] = None
+        self._rect_batch: Optional[gpu.types.GPUBatch] = None
+        self._line_batch: Optional[gpu.types.GPUBatch] = None
+
     @property
     def arrow_direction(self):
         return self._arrow_direction
@@ -395,58 +445,75 @@ class ButtonDrawer:
     def shader(self):
         return self._shader
 
+    def _build_batches(self, button: Button) -> None:
+        coords = button.get_coords()
+
+        self._rect_batch = batch_for_shader(
+            self.shader,
+            "TRIS",
+            {"pos": np.array([tuple(p) for p in coords], dtype=np.float32)},
+            indices=_RECT_IDX,
+        )
+
+        # Arrow pointing up.
+        if self.arrow_direction == "UP":
+            cord_center = Point(coords.center.x, coords.top_left.y)
+            line_pos = (
+                coords.bot_left,
+                cord_center,
+                cord_center,
+                coords.bot_right,
+            )
+
+        # Arrow pointing down.
+        else:
+            cord_center = Point(coords.center.x, coords.bot_left.y)
+            line_pos = (
+                coords.top_left,
+                cord_center,
+                cord_center,
+                coords.top_right,
+            )
+
+        self._line_batch = batch_for_shader(
+            self.shader,
+            "LINES",
+            {"pos": np.array([tuple(p) for p in line_pos], dtype=np.float32)},
+        )
+
     def draw_button(
         self, button: Button, region: bpy.types.Region, color: Float4
     ) -> None:
-        bgl.glEnable(bgl.GL_BLEND)
-        bgl.glLineWidth(0)
-        coords = button.get_region_coords(region)
-
-        # Draw rectangle.
-        # Bind the shader object. Required to be able to change uniforms of this shader.
-        if self.draw_rect:
-            self.shader.bind()
-            color_dimmed = [c * 0.4 for c in color]
-            self.shader.uniform_float("color", color_dimmed)
-            batch = batch_for_shader(
-                self.shader,
-                "TRIS",
-                {"pos": coords},
-                indices=((0, 1, 2), (2, 1, 3)),  # (2, 1, 3)
-            )
-            batch.draw(self.shader)
-
-        if self.draw_arrow:
-            # Draw arrow pointing up.
-            if self.arrow_direction == "UP":
-                cord_center = Point(coords.center.x, coords.top_left.y)
-                line_pos = (
-                    coords.bot_left,
-                    cord_center,
-                    cord_center,
-                    coords.bot_right,
-                )
+        gpu.state.blend_set("ALPHA")
 
-            # Draw arrow pointing down.
-            elif self.arrow_direction == "DOWN":
-                cord_center = Point(coords.center.x, coords.bot_left.y)
-                line_pos = (
-                    coords.top_left,
-                    cord_center,
-                    cord_center,
-                    coords.top_right,
-                )
+        # Only rebuild batches if geometry changed.
+        batch_key = self.arrow_direction
+        if batch_key != self._batch_key:
+            self._build_batches(button)
+            self._batch_key = batch_key
+
+        # Bind the shader object once for rectangle and arrow.
+        # Required to be able to change uniforms of this shader.
+        self.shader.bind()
 
-            else:
-                return
+        with gpu.matrix.push_pop():
+            # Same as Button.get_region_coords().
+            gpu.matrix.translate((0, region.height))
 
-            # Create line batch and draw it.
-            bgl.glLineWidth(3)
-            self._shader.bind()
-            self._shader.uniform_float("color", color)
-            # print(f"Drawing points: {line_pos}")
-            line_batch = batch_for_shader(self._shader, "LINES", {"pos": line_pos})
-            line_batch.draw(self._shader)
+            # Draw rectangle.
+            if self.draw_rect:
+                color_dimmed = [c * 0.4 for c in color]
+                self.shader.uniform_float("color", color_dimmed)
+                self._rect_batch.draw(self.shader)
+
+            if self.draw_arrow:
+                # Draw line batch.
+                gpu.state.line_width_set(3)
+                self.shader.uniform_float("color", color)
+                self._line_batch.draw(self.shader)
+                gpu.state.line_width_set(1)
+
+        gpu.state.blend_set("NONE")
 
 
 # The way this operator adds draw handlers and runs in modal mode is
@@ -457,20 +524,23 @@ class MV_OT_toggle_header(bpy.types.Operator):
     bl_label = "Toggle Header"
     # bl_options = {"REGISTER", "INTERNAL"}
 
+    # Only one instance should run, otherwise each one adds its own draw handlers.
+    is_running: bool = False
+
+    # Constants shared by all instances.
+    _AREAS_TO_PROCESS: Tuple[str, ...] = ("IMAGE_EDITOR", "SEQUENCE_EDITOR")
+    _AREA_REGION: Dict[str, str] = {
+        "IMAGE_EDITOR": "WINDOW",
+        "SEQUENCE_EDITOR": "PREVIEW",
+    }
+    _AREA_SPACE: Dict[str, bpy.types.Space] = {
+        "IMAGE_EDITOR": bpy.types.SpaceImageEditor,
+        "SEQUENCE_EDITOR": bpy.types.SpaceSequenceEditor,
+    }
+
     def __init__(self):
-        self._area_draw_handle_dict: Dict[str : List[Callable]] = {
-            "IMAGE_EDITOR": [],
-            "SEQUENCE_EDITOR": [],
-        }
-        self._areas_to_process: List[str] = ["IMAGE_EDITOR", "SEQUENCE_EDITOR"]
-        self._area_region_dict: Dict[str, str] = {
-            "IMAGE_EDITOR": "WINDOW",
-            "SEQUENCE_EDITOR": "PREVIEW",
-        }
-        self._area_space_type_dict: Dict[str, bpy.types.Space] = {
-            "IMAGE_EDITOR": bpy.types.SpaceImageEditor,
-            "SEQUENCE_EDITOR": bpy.types.SpaceSequenceEditor,
-        }
+        # Only one draw handler is added per area type.
+        self._area_draw_handle_dict: Dict[str, Any] = {}
 
         # Define variables to control our rectangle.
         btn_offset_y = -5
@@ -481,23 +551,30 @@ class MV_OT_toggle_header(bpy.types.Operator):
         self.btn_drawer = ButtonDrawer()
         # self.btn_drawer.draw_rect = True
 
-    def draw(self, context: bpy.types.Context) -> None:
+        # State of last redraw, to only redraw media area if it changed.
+        self._last_draw_state: Optional[Tuple[Any, ...]] = None
 
-        # Get active media area.
-        area = ops.active_media_area_obj
-        if not area:
+    def draw(
+        self, context: bpy.types.Context, area_type: str, region_type: str
+    ) -> None:
+        # Shared draw callback of all space types. Blender sets area and region
+        # of the region that is currently drawn, so no need to search for it.
+        # Area and region type this handler was registered for are passed as arguments.
+        # Handlers are only removed on next modal event, return early until then.
+        if not is_header_toggle_enabled():
             return
 
-        # We don't need it for the text editor.
-        if area.type not in self._areas_to_process:
+        area = bpy.context.area
+        region = bpy.context.region
+        if not area or not region:
             return
 
-        # Get region to display header toggle in.
-        region_name = self._area_region_dict[area.type]
-        region = get_region_by_name(area, region_name)
-        if not region:
+        if area.type != area_type or region.type != region_type:
+            return
+
+        # Only draw in active media area.
+        if area != ops.active_media_area_obj:
             return
-        # print(f"X: {region.x} Y: {region.y} WIDTH: {region.width} HEIGHT: {region.height}")
 
         # Set arrow direction depending on region header state.
         if area.spaces.active.show_region_header:
@@ -512,43 +589,60 @@ class MV_OT_toggle_header(bpy.types.Operator):
 
         # If cancel remove draw handler.
         if self.should_cancel():
-            for area_type, draw_handler_list in self._area_draw_handle_dict:
+            for area_type, draw_handler in self._area_draw_handle_dict.items():
 
-                region_type = self._area_region_dict[area_type]
-                space_type = self._area_space_type_dict[area_type]
+                region_type = self._AREA_REGION[area_type]
+                space_type = self._AREA_SPACE[area_type]
 
-                for draw_handler in draw_handler_list:
+                try:
                     space_type.draw_handler_remove(draw_handler, region_type)
+                except (ReferenceError, ValueError):
+                    # Handler was already removed by Blender.
+                    pass
 
-                draw_handler_list.clear()
+            self._area_draw_handle_dict.clear()
 
+            MV_OT_toggle_header.is_running = False
             return {"CANCELLED"}
 
-        # Redraw areas, otherwise button flickers.
-        for area in context.screen.areas:
-            area.tag_redraw()
-
         area = ops.active_media_area_obj
         if not area:
             return {"PASS_THROUGH"}
 
         # We don't need it for the text editor.
-        if area.type not in self._areas_to_process:
+        if area.type not in self._AREAS_TO_PROCESS:
             return {"PASS_THROUGH"}
 
-        region = get_region_of_area(area, self._area_region_dict[area.type])
-        if not region:
-            return {"PASS_THROUGH"}
+        # Media area might have changed to a space type that has no draw handler yet.
+        self.ensure_draw_handler(area.type)
 
-        # Check if mouse is in active_media_area.
-        if not is_mouse_in_region(region, event.mouse_x, event.mouse_y):
+        region = get_region_of_area(area, self._AREA_REGION[area.type])
+        if not region:
             return {"PASS_THROUGH"}
 
         # Check if mouse is in collision region.
         # Apply some padding to make it easier clickable.
         collision_rect = self.button.get_global_coords(region)
         collision_rect.apply_padding(10)
-        if not collision_rect.is_over(Point(event.mouse_x, event.mouse_y)):
+        is_over_button = is_mouse_in_region(
+            region, event.mouse_x, event.mouse_y
+        ) and collision_rect.is_over(Point(event.mouse_x, event.mouse_y))
+
+        # Only redraw the media area if something that affects the button changed,
+        # otherwise button flickers.
+        draw_state = (
+            area.as_pointer(),
+            area.type,
+            region.width,
+            region.height,
+            area.spaces.active.show_region_header,
+            is_over_button,
+        )
+        if draw_state != self._last_draw_state:
+            self._last_draw_state = draw_state
+            area.tag_redraw()
+
+        if not is_over_button:
             return {"PASS_THROUGH"}
 
         # If user clicks on the rectangle with leftmouse button, toggle header.
@@ -557,6 +651,11 @@ class MV_OT_toggle_header(bpy.types.Operator):
                 area.spaces.active.show_region_header = (
                     not area.spaces.active.show_region_header
                 )
+                logger.debug(
+                    "Toggled header of %s: %s",
+                    area.type,
+                    area.spaces.active.show_region_header,
+                )
 
             # If clicked return running modal, otherwise we also draw on media area.
             return {"RUNNING_MODAL"}
@@ -567,24 +666,38 @@ class MV_OT_toggle_header(bpy.types.Operator):
         return not self.context.window_manager.media_viewer.draw_header_toggle
 
     def invoke(self, context: bpy.types.Context, event: bpy.types.Event) -> Set[str]:
+        if MV_OT_toggle_header.is_running:
+            return {"CANCELLED"}
+
+        MV_OT_toggle_header.is_running = True
         self.context = context
 
-        # Add draw handler to each space type.
-        for area_type in self._areas_to_process:
-            region_type = self._area_region_dict[area_type]
-            space_type = self._area_space_type_dict[area_type]
-            self._area_draw_handle_dict[area_type].append(
-                space_type.draw_handler_add(
-                    self.draw, (context,), region_type, "POST_PIXEL"
-                )
-            )
+        # Add draw handler only to space types that exist on the screen.
+        # Others are added by modal() once the media area changes to them.
+        for area in context.screen.areas:
+            if area.type in self._AREAS_TO_PROCESS:
+                self.ensure_draw_handler(area.type)
 
         context.window_manager.modal_handler_add(self)
         return {"RUNNING_MODAL"}
 
+    def ensure_draw_handler(self, area_type: str) -> None:
+        if area_type in self._area_draw_handle_dict:
+            return
+
+        region_type = self._AREA_REGION[area_type]
+        space_type = self._AREA_SPACE[area_type]
+        self._area_draw_handle_dict[area_type] = space_type.draw_handler_add(
+            self.draw, (self.context, area_type, region_type), region_type, "POST_PIXEL"
+        )
+
 
 @persistent
 def load_post_start_toggle_header(_) -> None:
+    # Areas of previous file are freed, cached regions are invalid.
+    opsdata.clear_area_caches()
+    # Modal operators don't survive loading a file.
+    MV_OT_toggle_header.is_running = False
     bpy.ops.media_viewer.toggle_header("INVOKE_DEFAULT")
 
 
@@ -601,7 +714,8 @@ def register():
         bpy.utils.register_class(cls)
 
     for handler in load_post_handler:
-        bpy.app.handlers.load_post.append(load_post_start_toggle_header)
+        if handler not in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.append(handler)
 
     # draw_handlers_sqe.append(bpy.types.SpaceSequenceEditor.draw_handler_add(
     #     draw_text, (REGION_NAME,), REGION_NAME, "POST_PIXEL"
@@ -629,7 +743,8 @@ def unregister():
         bpy.types.SpaceSequenceEditor.draw_handler_remove(handler, REGION_NAME)
 
     for handler in load_post_handler:
-        bpy.app.handlers.load_post.remove(handler)
+        if handler in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(handler)
 
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -650,6 +650,7 @@ class MV_OT_screen_full_area(bpy.types.Operator):
         # active_media_area_obj = area_media
         ctx = opsdata.get_context_for_area(area_media)
         bpy.ops.screen.screen_full_area(ctx, use_hide_panels=True)
+        opsdata.clear_area_caches()
         is_fullscreen = not is_fullscreen
 
         # Select previous filepath if in FILE_BROWSER area.
@@ -34,6 +34,17 @@ from media_viewer.log import LoggerFactory
 
 logger = LoggerFactory.getLogger(name=__name__)
 
+# Maps (area pointer, area type) to a {region.type: region} dictionary.
+_region_cache: Dict[Tuple[int, str], Dict[str, bpy.types.Region]] = {}
+
+# Maps (screen pointer, area type) to the first area of that type on the screen.
+_area_cache: Dict[Tuple[int, str], bpy.types.Area] = {}
+
+# Both caches have to be cleared whenever areas are created or removed.
+# Areas can also be joined or split by the user, so the caches
+# are also cleared if the amount of areas of a screen changes.
+_screen_area_count: Dict[int, int] = {}
+
 
 def is_movie(filepath: Path) -> bool:
     if filepath.suffix.lower() in vars.EXT_MOVIE:
@@ -109,9 +120,20 @@ def find_area(context: bpy.types.Context, area_name: str) -> Optional[bpy.types.
     else:
         screen = context.screen
 
+    validate_area_caches(screen)
+
+    key = (screen.as_pointer(), area_name)
+    area = _area_cache.get(key)
+    # Area type might have been changed since.
+    if area and area.type == area_name:
+        return area
+
     for area in screen.areas:
         if area.type == area_name:
+            _area_cache[key] = area
             return area
+
+    _area_cache.pop(key, None)
     return None
 
 
@@ -156,6 +178,34 @@ def fit_view(context: bpy.types.Context, area: bpy.types.Area) -> None:
         fit_timeline_view(context, area=area)
 
 
+def get_region_of_area(
+    area: bpy.types.Area, region_type: str
+) -> Optional[bpy.types.Region]:
+    validate_area_caches(area.id_data)
+
+    key = (area.as_pointer(), area.type)
+    regions = _region_cache.get(key)
+    if regions is None:
+        regions = {region.type: region for region in area.regions}
+        _region_cache[key] = regions
+    return regions.get(region_type)
+
+
+def validate_area_caches(screen: bpy.types.Screen) -> None:
+    screen_pointer = screen.as_pointer()
+    area_count = len(screen.areas)
+    if _screen_area_count.get(screen_pointer) != area_count:
+        _region_cache.clear()
+        _area_cache.clear()
+        _screen_area_count[screen_pointer] = area_count
+
+
+def clear_area_caches() -> None:
+    _region_cache.clear()
+    _area_cache.clear()
+    _screen_area_count.clear()
+
+
 def get_context_for_area(area: bpy.types.Area, region_type="WINDOW") -> Dict:
     for region in area.regions:
         if region.type == region_type:
@@ -191,6 +241,7 @@ def split_area(
 
     start_areas = screen.areas[:]
     bpy.ops.screen.area_split(ctx, direction=direction, factor=factor)
+    clear_area_caches()
 
     for area in screen.areas:
         if area not in start_areas:
@@ -201,6 +252,7 @@ def split_area(
 def close_area(area: bpy.types.Area) -> None:
     ctx = get_context_for_area(area)
     bpy.ops.screen.area_close(ctx)
+    clear_area_caches()
 
 
 def setup_filebrowser_area(filebrowser_area: bpy.types.Area) -> None:
@@ -93,10 +93,11 @@ SVN_STATUS_DATA = OrderedDict(
 
 
 # Based on PySVN/svn/constants.py/STATUS_TYPE_LOOKUP.
-ENUM_SVN_STATUS = [
+# A tuple, so the same items are shared by every EnumProperty using them.
+ENUM_SVN_STATUS = tuple(
     (status, status.title(), SVN_STATUS_DATA[status][1], SVN_STATUS_DATA[status][0], i)
     for i, status in enumerate(SVN_STATUS_DATA.keys())
-]
+)
 
 
 SVN_STATUS_CHAR_TO_NAME = {
@@ -114,3 +115,8 @@ SVN_STATUS_CHAR_TO_NAME = {
 }
 
 SVN_STATUS_NAME_TO_CHAR = {value: key for key, value in SVN_STATUS_CHAR_TO_NAME.items()}
+
+# The integer values that status EnumProperties store for each status, so they
+# can be assigned with dictionary syntax, skipping the RNA setter.
+SVN_STATUS_NAME_TO_INT = {item[0]: item[4] for item in ENUM_SVN_STATUS}
+SVN_STATUS_CHAR_TO_INT = {key: SVN_STATUS_NAME_TO_INT[value] for key, value in SVN_STATUS_CHAR_TO_NAME.items()}
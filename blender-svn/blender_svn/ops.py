@@ -395,6 +395,7 @@ class SVN_cleanup(SVN_Operator, bpy.types.Operator):
 
     def execute(self, context: bpy.types.Context) -> Set[str]:
         context.scene.svn.external_files.clear()
+        context.scene.svn.invalidate_file_index()
         self.execute_svn_command(context, 'svn cleanup')
         self.report({'INFO'}, "SVN Cleanup complete.")
 
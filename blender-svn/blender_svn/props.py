@@ -23,6 +23,7 @@ from typing import Optional, Dict, Any, List, Tuple, Set
 
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 
 import bpy, logging
 from bpy.props import IntProperty, StringProperty, CollectionProperty, BoolProperty, EnumProperty
@@ -33,12 +34,33 @@ wheels.preload_dependencies()
 from blender_asset_tracer import trace
 
 from .util import make_getter_func, make_setter_func_readonly, redraw_viewport
-from .svn_log import reload_svn_log
+from .svn_log import reload_svn_log, get_log_file_index
 from . import constants
 from .background_process import processes
 
 logger = logging.getLogger("SVN")
 
+# Maps a scene's pointer to the amount of entries in its external_files
+# collection and a {svn_path: index} dictionary of those entries, so files
+# don't need to be searched by looping over the whole collection.
+_file_index_cache: Dict[int, Tuple[int, Dict[str, int]]] = {}
+
+# Same as above, but for the log collection, mapping revision numbers to indicies.
+_log_revision_index_cache: Dict[int, Tuple[int, Dict[int, int]]] = {}
+
+
+@bpy.app.handlers.persistent
+def clear_file_index_cache(_dummy1=None, _dummy2=None):
+    """Scene pointers can be re-used by the scenes of a newly loaded file."""
+    _file_index_cache.clear()
+
+@lru_cache(maxsize=4096)
+def _to_absolute_path(svn_directory: str, svn_path: str) -> Path:
+    """Path objects are immutable, so they can be shared instead of constructing
+    and parsing new ones every time a file entry's path is accessed, eg. for
+    every row of the file list on every redraw."""
+    return Path(svn_directory).joinpath(Path(svn_path))
+
 ################################################################################
 ############################# DATA TYPES #######################################
 ################################################################################
@@ -96,7 +118,7 @@ class SVN_file(bpy.types.PropertyGroup):
         """Return absolute path on the file system."""
         scene = self.id_data
         svn = scene.svn
-        return Path(svn.svn_directory).joinpath(Path(self.svn_path))
+        return _to_absolute_path(svn.svn_directory, self.svn_path)
 
     @property
     def relative_path(self) -> str:
@@ -121,10 +143,7 @@ class SVN_file(bpy.types.PropertyGroup):
 
     @property
     def exists(self) -> bool:
-        svn = self.id_data.svn
-        svn_directory = Path(svn.svn_directory)
-        full_path = svn_directory.joinpath(Path(self.svn_path))
-        return full_path.exists()
+        return self.absolute_path.exists()
 
     @property
     def status_icon(self) -> str:
@@ -169,6 +188,10 @@ class SVN_log(bpy.types.PropertyGroup):
         name="Revision Date",
         description="Date when the current revision was committed",
     )
+    revision_date_short: StringProperty(
+        name="Short Revision Date",
+        description="Month and day of the revision date, to be displayed in the log list",
+    )
     revision_author: StringProperty(
         name="Revision Author",
         description="SVN username of the revision author",
@@ -177,6 +200,10 @@ class SVN_log(bpy.types.PropertyGroup):
         name = "Commit Message",
         description="Commit message written by the commit author to describe the changes in this revision",
     )
+    commit_message_short: StringProperty(
+        name = "Short Commit Message",
+        description="First line of the commit message, shortened to be displayed in the log list",
+    )
 
     changed_files: CollectionProperty(
         type = SVN_file,
@@ -295,12 +322,14 @@ class SVN_scene_properties(bpy.types.PropertyGroup):
 
     def remove_file_entry(self, file_entry: SVN_file):
         """Remove a file entry from the file list, based on its filepath."""
-        for i, f in enumerate(self.external_files):
-            if f == file_entry:
-                self.external_files.remove(i)
-                if i <= self.external_files_active_index:
-                    self.external_files_active_index -= 1
-                return
+        i = self.get_file_by_svn_path(file_entry.svn_path, get_index=True)
+        if i is None:
+            return
+        self.external_files.remove(i)
+        # Indicies of all following entries have shifted.
+        self.invalidate_file_index()
+        if i <= self.external_files_active_index:
+            self.external_files_active_index -= 1
 
     def absolute_to_svn_path(self, absolute_path: Path) -> Path:
         if type(absolute_path) == str:
@@ -308,17 +337,61 @@ class SVN_scene_properties(bpy.types.PropertyGroup):
         svn_dir = Path(self.svn_directory)
         return absolute_path.relative_to(svn_dir)
 
+    def add_file_entry(self, svn_path: Path) -> SVN_file:
+        """Add a file entry to the end of the file list, and to the index of
+        file entries if it is up to date, so it doesn't need to be rebuilt."""
+        key = self.id_data.as_pointer()
+        num_files = len(self.external_files)
+        file_entry = self.external_files.add()
+        file_entry['svn_path'] = svn_path.as_posix()
+        file_entry['name'] = svn_path.name
+
+        cached = _file_index_cache.get(key)
+        if cached and cached[0] == num_files:
+            file_index = cached[1]
+            file_index[svn_path.as_posix()] = num_files
+            _file_index_cache[key] = (num_files + 1, file_index)
+        return file_entry
+
     def get_file_by_svn_path(self, svn_path: str or Path, get_index=False) -> Optional[Tuple[int, SVN_file]]:
         if isinstance(svn_path, Path):
             # We must use isinstance() instead of type() because apparently 
             # the Path() constructor returns a WindowsPath object on Windows.
             svn_path = svn_path.as_posix()
 
-        for i, file in enumerate(self.external_files):
-            if file.svn_path == svn_path:
-                if get_index:
-                    return i
-                return file
+        i = self.get_file_index().get(svn_path)
+        if i is None:
+            return
+        file = self.external_files[i]
+        if file.svn_path != svn_path:
+            # Entries were modified without invalidating the cache.
+            self.invalidate_file_index()
+            i = self.get_file_index().get(svn_path)
+            if i is None:
+                return
+            file = self.external_files[i]
+
+        if get_index:
+            return i
+        return file
+
+    def get_file_index(self) -> Dict[str, int]:
+        """Return a {svn_path: index} dictionary of the file entries.
+        It is only rebuilt when the amount of file entries changed or the
+        cache was invalidated, which is required whenever entries are removed
+        or the collection is cleared."""
+        key = self.id_data.as_pointer()
+        num_files = len(self.external_files)
+        cached = _file_index_cache.get(key)
+        if cached and cached[0] == num_files:
+            return cached[1]
+
+        file_index = {f.svn_path: i for i, f in enumerate(self.external_files)}
+        _file_index_cache[key] = (num_files, file_index)
+        return file_index
+
+    def invalidate_file_index(self):
+        _file_index_cache.pop(self.id_data.as_pointer(), None)
 
     external_files: bpy.props.CollectionProperty(type=SVN_file)  # type: ignore
 
@@ -479,18 +552,41 @@ class SVN_scene_properties(bpy.types.PropertyGroup):
         except IndexError:
             return None
 
+    def get_log_revision_index(self) -> Dict[int, int]:
+        """Return a {revision_number: index} dictionary of the log entries.
+        It is rebuilt whenever the number of log entries changes."""
+        key = self.id_data.as_pointer()
+        num_logs = len(self.log)
+        cached = _log_revision_index_cache.get(key)
+        if cached and cached[0] == num_logs:
+            return cached[1]
+
+        revision_index = {log.revision_number: i for i, log in enumerate(self.log)}
+        _log_revision_index_cache[key] = (num_logs, revision_index)
+        return revision_index
+
     def get_log_by_revision(self, revision: int) -> Tuple[int, SVN_log]:
-        for i, log in enumerate(self.log):
-            if log.revision_number == revision:
-                return i, log
+        idx = self.get_log_revision_index().get(revision)
+        if idx is None:
+            return
+        log = self.log[idx]
+        if log.revision_number == revision:
+            return idx, log
+
+        # The log was reloaded with a different set of entries of the same
+        # length, so the index is out of date.
+        _log_revision_index_cache.pop(self.id_data.as_pointer(), None)
+        idx = self.get_log_revision_index().get(revision)
+        if idx is not None:
+            return idx, self.log[idx]
 
     def get_latest_revision_of_file(self, svn_path: str) -> int:
-        svn_path = str(svn_path)
-        for log in reversed(self.log):
-            for changed_file in log.changed_files:
-                if changed_file.svn_path == "/"+str(svn_path):
-                    return log.revision_number
-        return 0
+        # The log file index lists the log entries of each file in order, so
+        # the whole log doesn't need to be searched whenever the active file changes.
+        log_indicies = get_log_file_index(self).get("/"+str(svn_path))
+        if not log_indicies:
+            return 0
+        return self.log[log_indicies[-1]].revision_number
 
     def is_file_outdated(self, file: SVN_file) -> bool:
         """A file may have the 'modified' state while also being outdated.
@@ -18,9 +18,9 @@
 #
 # (c) 2022, Blender Foundation - Demeter Dzadik
 
-from typing import List, Dict, Union, Any, Set, Optional, Tuple
+from typing import List, Dict, Union, Any, Set, Optional, Tuple, NamedTuple
 from pathlib import Path
-import threading, subprocess
+import threading, subprocess, re
 
 import bpy
 from bpy.props import IntProperty, BoolProperty
@@ -31,6 +31,39 @@ from .execute_subprocess import execute_svn_command
 from .background_process import BackgroundProcess, process_in_background, processes
 from .ui import dots
 
+# Maps a scene's pointer to the amount of its log entries and a
+# {svn_path: [log entry indicies]} dictionary of the files changed by those entries.
+# svn_paths are stored as they are in the log, with a leading slash.
+_log_file_index_cache: Dict[int, Tuple[int, Dict[str, List[int]]]] = {}
+
+
+def get_log_file_index(svn) -> Dict[str, List[int]]:
+    """Return a dictionary mapping svn_paths to the indicies of the log entries
+    that affected them. It is built while reading the log file, and only rebuilt
+    here if the log has changed in some other way."""
+    key = svn.id_data.as_pointer()
+    num_logs = len(svn.log)
+    cached = _log_file_index_cache.get(key)
+    if cached and cached[0] == num_logs:
+        return cached[1]
+
+    file_index: Dict[str, List[int]] = {}
+    for idx, log_entry in enumerate(svn.log):
+        for changed_file in log_entry.changed_files:
+            file_index.setdefault(changed_file.svn_path, []).append(idx)
+    _log_file_index_cache[key] = (num_logs, file_index)
+    return file_index
+
+
+# Maps (scene pointer, list id, property name, is file browser) to the state
+# that the SVN_UL_log filter result was computed for, and that result.
+_log_filter_cache: Dict[Tuple[int, str, str, bool], Tuple[Tuple, List[int], List[int]]] = {}
+
+# Maps (scene pointer, list id, is file browser) to the svn_path and revision
+# of the active file, and the indicies of log entries that affected it.
+# Reset by SVN_UL_log.filter_items() on each redraw, and used by draw_item().
+_log_active_file_info: Dict[Tuple[int, str, bool], Tuple[str, int, Set[int]]] = {}
+
 ################################################################################
 ################################ UI / UX #######################################
 ################################################################################
@@ -58,32 +91,59 @@ class SVN_UL_log(bpy.types.UIList):
         default = False
     )
 
-    def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index=0, flt_flag=0):
         if self.layout_type != 'DEFAULT':
             raise NotImplemented
 
         svn = data
         log_entry = item
 
-        num, auth, date, msg = layout_log_split(layout.row())
-
+        # Same as layout_log_split(), inlined since this runs for every row.
+        main = layout.row().split(factor=0.4)
+        num_and_auth_split = main.row().split(factor=0.3)
+        num = num_and_auth_split.row()
+        auth = num_and_auth_split.row()
+        date_and_msg_split = main.row().split(factor=0.3)
+        date = date_and_msg_split.row()
+        msg = date_and_msg_split.row()
+
+        # filter_items() runs before the rows are drawn and stores the active
+        # file, so it doesn't have to be looked up again for every row.
         is_filebrowser = context.space_data.type == 'FILE_BROWSER'
-        active_file = svn.get_filebrowser_active_file(context) if is_filebrowser else svn.active_file
-        num.label(text=str(log_entry.revision_number))
-        if item.revision_number == active_file.revision:
-            num.operator('svn.tooltip_log', text="", icon='LAYER_ACTIVE', emboss=False).log_rev=log_entry.revision_number
-        elif log_entry.changed_file(active_file.svn_path):
+        active_svn_path, active_revision, active_log_indicies = self.get_active_file_info(
+            context, svn, is_filebrowser
+        )
+        revision_number = log_entry.revision_number
+        num.label(text=str(revision_number))
+        if revision_number == active_revision:
+            num.operator('svn.tooltip_log', text="", icon='LAYER_ACTIVE', emboss=False).log_rev=revision_number
+        elif index in active_log_indicies:
             get_older = num.operator('svn.download_file_revision', text="", icon='IMPORT', emboss=False)
-            get_older.revision = log_entry.revision_number
-            get_older.file_rel_path = active_file.svn_path
+            get_older.revision = revision_number
+            get_older.file_rel_path = active_svn_path
         auth.label(text=log_entry.revision_author)
-        date.label(text=log_entry.revision_date.split(" ")[0][5:])
+        date.label(text=log_entry.revision_date_short)
 
-        commit_msg = log_entry.commit_message
-        commit_msg = commit_msg.split("\n")[0] if "\n" in commit_msg else commit_msg
-        commit_msg = commit_msg[:50]+"..." if len(commit_msg) > 52 else commit_msg
         msg.alignment = 'LEFT'
-        msg.operator("svn.display_commit_message", text=commit_msg, emboss=False).log_rev=log_entry.revision_number
+        msg.operator("svn.display_commit_message", text=log_entry.commit_message_short, emboss=False).log_rev=revision_number
+
+    def get_active_file_info(self, context, svn, is_filebrowser: bool) -> Tuple[str, int, Set[int]]:
+        """Return svn_path and revision of the active file and the indicies
+        of the log entries that affected it."""
+        info_key = (svn.id_data.as_pointer(), self.list_id, is_filebrowser)
+        info = _log_active_file_info.get(info_key)
+        if info:
+            return info
+
+        active_file = svn.get_filebrowser_active_file(context) if is_filebrowser else svn.active_file
+        file_index = get_log_file_index(svn)
+        info = (
+            active_file.svn_path,
+            active_file.revision,
+            set(file_index.get("/"+active_file.svn_path, ())),
+        )
+        _log_active_file_info[info_key] = info
+        return info
 
     def filter_items(self, context, data, propname):
         """Custom filtering functionality:
@@ -93,30 +153,49 @@ class SVN_UL_log(bpy.types.UIList):
         svn = data
         log_entries = getattr(data, propname)
 
-        # Start off with all entries flagged as visible.
-        flt_flags = [self.bitflag_filter_item] * len(log_entries)
+        is_filebrowser = context.space_data.type == 'FILE_BROWSER'
+        active_file = svn.get_filebrowser_active_file(context) if is_filebrowser else svn.active_file
+
+        # Refresh active file info for draw_item(), which runs after this.
+        _log_active_file_info.pop((svn.id_data.as_pointer(), self.list_id, is_filebrowser), None)
+
+        # This runs on every redraw of the list, so re-use the previous result
+        # as long as nothing that affects it has changed.
+        # UIList instances are short-lived, so the cache is stored in the module.
+        cache_key = (svn.id_data.as_pointer(), self.list_id, propname, is_filebrowser)
+        filter_state = (
+            active_file.svn_path,
+            len(log_entries),
+            log_entries[-1].revision_number if log_entries else 0,
+            self.show_all_logs,
+            self.filter_name,
+        )
+        cached = _log_filter_cache.get(cache_key)
+        if cached and cached[0] == filter_state:
+            return cached[1], cached[2]
+
         # Always sort by descending revision number
         flt_neworder = sorted(range(len(log_entries)), key=lambda i: log_entries[i].revision_number)
         flt_neworder.reverse()
 
-        is_filebrowser = context.space_data.type == 'FILE_BROWSER'
-        active_file = svn.get_filebrowser_active_file(context) if is_filebrowser else svn.active_file
-
-        if not self.show_all_logs:
-            # Filter out log entries that did not affect the selected file.
-            for idx, log_entry in enumerate(log_entries):
-                for affected_file in log_entry.changed_files:
-                    if affected_file.svn_path == "/"+active_file.svn_path:
-                        # If the active file is one of the files affected by this log
-                        # entry, break the for loop and skip the else block.
-                        break
-                else:
-                    flt_flags[idx] = 0
+        bitflag = self.bitflag_filter_item
+        if self.show_all_logs:
+            # Start off with all entries flagged as visible.
+            flt_flags = [bitflag] * len(log_entries)
+        else:
+            # Only flag log entries that affected the selected file as visible.
+            flt_flags = [0] * len(log_entries)
+            file_index = get_log_file_index(svn)
+            for idx in file_index.get("/"+active_file.svn_path, ()):
+                flt_flags[idx] = bitflag
 
         if self.filter_name:
             # Simple search:
             # Filter out log entries that don't match anything in the string search.
             for idx, log_entry in enumerate(log_entries):
+                if not flt_flags[idx]:
+                    # Already filtered out, no need to build its search string.
+                    continue
                 if self.filter_name not in " ".join(
                     [
                         "r"+str(log_entry.revision_number),
@@ -127,6 +206,7 @@ class SVN_UL_log(bpy.types.UIList):
                 ):
                     flt_flags[idx] = 0
 
+        _log_filter_cache[cache_key] = (filter_state, flt_flags, flt_neworder)
         return flt_flags, flt_neworder
 
     def draw_filter(self, context, layout):
@@ -297,78 +377,161 @@ def get_log_file_path(context) -> Path:
     return Path(context.scene.svn.svn_directory+"/.svn/svn.log")
 
 
-def reload_svn_log(self, context):
-    """Read the svn.log file (written by this addon) into the log entry list."""
+LOG_SEPARATOR_RE = re.compile(r"^-{72}$", re.MULTILINE)
 
-    svn = self
-    svn.log.clear()
 
-    # Read file into lists of lines where each list is one log entry
-    filepath = get_log_file_path(context)
-    if not filepath.exists():
-        # Nothing to read!
-        return
+class LogRecord(NamedTuple):
+    """Plain Python representation of an SVN log entry, parsed from the log file."""
+    revision_number: int
+    revision_author: str
+    revision_date: str
+    revision_date_short: str
+    commit_message: str
+    commit_message_short: str
+    # (status character, svn_path) of each file changed in this revision.
+    changed_files: List[Tuple[str, str]]
+
+
+def parse_svn_log(data: str, previous_rev_number=0) -> List[LogRecord]:
+    """Parse the text of an svn.log file into log records, without touching
+    any Blender data.
+    previous_rev_number should be the last revision that is already loaded,
+    when parsing entries that continue an existing log."""
+
+    # Lines of dashes separate the log entries. The first part is before the
+    # very first line of dashes, the last part is after the last line of dashes,
+    # so it belongs to an entry that is not complete yet.
+    parts = LOG_SEPARATOR_RE.split(data)
+    chunks = [
+        # Ignore empty lines.
+        [line for line in part.split("\n") if line]
+        for part in parts[1:-1]
+    ]
 
-    chunks = []
-    with open(filepath, 'r') as f:
-        next(f) # Skip the first line of dashes.
-        chunk = []
-        for line in f:
-            line = line.replace("\n", "")
-            if line == "-" * 72:
-                # Line of dashes indicates the log entry is over.
-                chunks.append(chunk)
-                chunk = []
-                continue
-            if not line:
-                # Ignore empty lines.
-                continue
-            chunk.append(line)
-
-    previous_rev_number = 0
+    records = []
+    num_skipped = 0
     for chunk in chunks:
         # Read the first line of the svn log containing revision number, author,
         # date and commit message length.
         r_number, r_author, r_date, r_msg_length = chunk[0].split(" | ")
         r_number = int(r_number[1:])
         if r_number != previous_rev_number+1:
-            # print(f"SVN: Warning: Revision order seems wrong at r{r_number}")
             # TODO: Currently this can happen when multiple Blender instances are running and end up writing the same log entry to the .log file multiple times.
             # This is not very ideal!
+            num_skipped += 1
             continue
         previous_rev_number = r_number
 
-        r_msg_length = int(r_msg_length.split(" ")[0])
-
-        log_entry = svn.log.add()
-        log_entry.revision_number = r_number
-        log_entry.revision_author = r_author
-
-        log_entry.revision_date = svn_date_simple(r_date)
+        r_msg_length = int(r_msg_length[:r_msg_length.index(" ")])
 
         # File change set is on line 3 until the commit message begins...
+        changed_files = []
         file_change_lines = chunk[2:-(r_msg_length)]
         for line in file_change_lines:
-            if not line:
-                print(chunk)
             line = line.strip()
             status_char = line[0]
             file_path = line[2:]
             if ' (from ' in file_path:
                 # If the file was moved, let's just ignore that information for now.
                 # TODO: This can be improved later if neccessary.
-                file_path = file_path.split(" (from ")[0]
-
+                file_path = file_path[:file_path.index(" (from ")]
+            # Paths in the log are repository paths, which always use forward
+            # slashes, so they don't need to be converted with Path().as_posix().
+            changed_files.append((status_char, file_path))
+
+        # First line of the commit message, as displayed in the log list.
+        commit_msg = chunk[-r_msg_length] if r_msg_length else ""
+
+        revision_date = svn_date_simple(r_date)
+
+        records.append(LogRecord(
+            revision_number = r_number,
+            revision_author = r_author,
+            revision_date = revision_date,
+            # Month and day, as displayed in the log list.
+            revision_date_short = revision_date[5:revision_date.index(" ")],
+            # Most commit messages are a single line, which needs no joining.
+            commit_message = chunk[-1] if r_msg_length == 1 else "\n".join(chunk[-r_msg_length:]),
+            commit_message_short = commit_msg[:50]+"..." if len(commit_msg) > 52 else commit_msg,
+            changed_files = changed_files,
+        ))
+
+    if num_skipped:
+        # Report once per parse rather than for every skipped entry.
+        print(f"SVN: Warning: Skipped {num_skipped} log entries with unexpected revision order.")
+
+    return records
+
+
+def add_log_records(svn, records: List[LogRecord]) -> None:
+    """Add log records to the log entry list in a single pass.
+    Values are assigned with dictionary syntax, which skips the RNA property setters."""
+    key = svn.id_data.as_pointer()
+    file_index = get_log_file_index(svn)
+
+    for record in records:
+        log_entry_idx = len(svn.log)
+        log_entry = svn.log.add()
+        log_entry['revision_number'] = record.revision_number
+        log_entry['revision_author'] = record.revision_author
+        log_entry['revision_date'] = record.revision_date
+        log_entry['revision_date_short'] = record.revision_date_short
+        log_entry['commit_message'] = record.commit_message
+        log_entry['commit_message_short'] = record.commit_message_short
+
+        for status_char, svn_path in record.changed_files:
             log_file_entry = log_entry.changed_files.add()
-            log_file_entry['name'] = Path(file_path).name
-            log_file_entry['svn_path'] = Path(file_path).as_posix()
-            log_file_entry.revision = r_number
-            log_file_entry.status = constants.SVN_STATUS_CHAR_TO_NAME[status_char]
+            log_file_entry['name'] = svn_path[svn_path.rfind('/')+1:]
+            log_file_entry['svn_path'] = svn_path
+            log_file_entry['revision'] = record.revision_number
+            log_file_entry['status'] = constants.SVN_STATUS_CHAR_TO_INT[status_char]
+            file_index.setdefault(svn_path, []).append(log_entry_idx)
+
+    _log_file_index_cache[key] = (len(svn.log), file_index)
+
+
+def reload_svn_log(self, context):
+    """Read the svn.log file (written by this addon) into the log entry list."""
+
+    svn = self
+    svn.log.clear()
+    _log_filter_cache.clear()
+    _log_file_index_cache[svn.id_data.as_pointer()] = (0, {})
+
+    # Read file into lists of lines where each list is one log entry
+    filepath = get_log_file_path(context)
+    if not filepath.exists():
+        # Nothing to read!
+        return
+
+    # Text mode, so \r\n line endings written on Windows become \n,
+    # which the entry separator is matched against.
+    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+        data = f.read()
 
-        log_entry['commit_message'] = "\n".join(chunk[-r_msg_length:])
+    add_log_records(svn, parse_svn_log(data))
 
 
-def write_to_svn_log_file_and_storage(context, data_str: str) -> int:
+def append_svn_log_chunk(context, data_str: str, records: Optional[List[LogRecord]] = None) -> None:
+    """Parse newly fetched `svn log` output and add its entries to the end of the
+    log entry list, without re-reading the whole svn.log file.
+    If the output was already parsed in a background thread, the resulting
+    records can be passed, so it doesn't need to be parsed again."""
+
+    svn = context.scene.svn
+    latest_log_rev = 0
+    if len(svn.log) > 0:
+        latest_log_rev = svn.log[-1].revision_number
+
+    if records is None or (records and records[0].revision_number != latest_log_rev+1):
+        # The records don't continue the loaded log, eg. because it was
+        # re-loaded since they were parsed.
+        records = parse_svn_log(data_str, latest_log_rev)
+
+    add_log_records(svn, records)
+
+
+def write_to_svn_log_file_and_storage(context, data_str: str, records: Optional[List[LogRecord]] = None) -> int:
     """
     Get all SVN Log entries from the remote repo in the background,
     without freezing up the UI, by calling this function every 3 seconds.
@@ -384,10 +547,18 @@ def write_to_svn_log_file_and_storage(context, data_str: str) -> int:
     file_existed = False
     if log_file_path.exists():
         file_existed = True
-        svn.reload_svn_log(context)
+        if len(svn.log) == 0:
+            # Only read the whole file if it isn't loaded yet. After that,
+            # only the new entries are parsed and added.
+            svn.reload_svn_log(context)
     num_entries = len(svn.log)
 
-    with open(log_file_path, 'a+') as f:
+    # On Windows, the `svn log` command outputs lines with all sorts of \r and \n shennanigans.
+    # TODO: For this reason, this should be implemented with the --xml arg.
+    data_str = data_str.replace("\r", "")
+    new_data_str = data_str
+
+    with open(log_file_path, 'a+', encoding='utf-8') as f:
         # Append to the file, create it if necessary.
         if file_existed:
             # We want to skip the first line of the svn log when continuing,
@@ -396,14 +567,11 @@ def write_to_svn_log_file_and_storage(context, data_str: str) -> int:
             data_str = data_str[73:] # 72 dashes and a newline
             data_str = "\n" + data_str # TODO: This is untested on windows.
 
-        # On Windows, the `svn log` command outputs lines with all sorts of \r and \n shennanigans.
-        # TODO: For this reason, this should be implemented with the --xml arg.
-        data_str = data_str.replace("\r", "")
         if data_str.endswith("\n"):
             data_str = data_str[:-1]
         f.write(data_str)
 
-    svn.reload_svn_log(context)
+    append_svn_log_chunk(context, new_data_str, records)
 
     print(f"SVN Log now at r{context.scene.svn.log[-1].revision_number}")
     return len(svn.log) - num_entries
@@ -416,6 +584,9 @@ class BGP_SVN_Log(BackgroundProcess):
     repeat_delay = 3
     debug = False
 
+    # The log entries parsed from the output, in the same thread that fetched it.
+    log_records: Optional[List[LogRecord]] = None
+
     def tick(self, context, prefs):
             redraw_viewport()
 
@@ -435,12 +606,16 @@ class BGP_SVN_Log(BackgroundProcess):
         # must check, and there is no safe way to check it, so let's just 
         # catch and handle the potential error.
         try:
-            self.output = execute_svn_command(
+            output = execute_svn_command(
                 context,
                 f"svn log {svn.svn_url} --verbose -r{latest_log_rev+1}:HEAD --limit 10", 
                 print_errors = False,
                 use_cred = True
             )
+            # Parse the output here rather than on the main thread. Only adding
+            # the log entries to Blender data needs to happen in process_output().
+            self.log_records = parse_svn_log(output.replace("\r", ""), latest_log_rev)
+            self.output = output
             self.debug_print("Output: \n" + self.output)
         except subprocess.CalledProcessError as error:
             error_msg = error.stderr.decode()
@@ -451,7 +626,8 @@ class BGP_SVN_Log(BackgroundProcess):
                 self.error = error_msg
 
     def process_output(self, context, prefs):
-        num_logs = write_to_svn_log_file_and_storage(context, self.output)
+        num_logs = write_to_svn_log_file_and_storage(context, self.output, self.log_records)
+        self.log_records = None
         if num_logs < 10:
             self.stop()
 
@@ -36,6 +36,7 @@ from .util import get_addon_prefs, svn_date_simple, redraw_viewport
 from . import constants
 
 from .background_process import BackgroundProcess, process_in_background, processes
+from .props import clear_file_index_cache
 
 class SVN_explain_status(bpy.types.Operator):
     bl_idname = "svn.explain_status"
@@ -145,6 +146,7 @@ def init_svn(context, dummy):
     svn.log_active_index = len(svn.log)-1
     if not in_repo:
         svn.external_files.clear()
+        svn.invalidate_file_index()
         svn.log.clear()
         print("SVN: Initialization cancelled: This .blend is not in an SVN repository.")
         return
@@ -153,10 +155,8 @@ def init_svn(context, dummy):
 
     current_blend_file = svn.current_blend_file
     if not current_blend_file:
-        f = svn.external_files.add()
         svn_path = svn.absolute_to_svn_path(bpy.data.filepath)
-        f['svn_path'] = str(svn_path)
-        f['name'] = svn_path.name
+        f = svn.add_file_entry(svn_path)
         f.status = 'unversioned'
         f.is_referenced = True
 
@@ -229,7 +229,7 @@ def update_file_list(context, file_statuses: Dict[str, Tuple[str, str, int]]):
     svn = context.scene.svn
     svn.timestamp_last_status_update = datetime.strftime(datetime.now(), "%Y/%m/%d %H:%M:%S")
 
-    posix_paths = []
+    posix_paths = set()
     new_files_on_repo = set()
     for filepath_str, status_info in file_statuses.items():
         svn_path = Path(filepath_str)
@@ -243,15 +243,13 @@ def update_file_list(context, file_statuses: Dict[str, Tuple[str, str, int]]):
             # .blend### are Blender backup files.
             continue
 
-        posix_paths.append(svn_path.as_posix())
+        posix_paths.add(svn_path.as_posix())
         wc_status, repos_status, revision = status_info
 
         file_entry = svn.get_file_by_svn_path(svn_path)
         entry_existed = True
         if not file_entry:
-            file_entry = svn.external_files.add()
-            file_entry['svn_path'] = svn_path.as_posix()
-            file_entry['name'] = svn_path.name
+            file_entry = svn.add_file_entry(svn_path)
             entry_existed = False
             if not file_entry.exists:
                 new_files_on_repo.add((file_entry, repos_status))
@@ -400,6 +398,8 @@ def timer_init_svn(_dummy1=None, _dummy2=None):
 
 
 def register():
+    # Must run before init_svn, which looks up file entries.
+    bpy.app.handlers.load_post.append(clear_file_index_cache)
     bpy.app.handlers.load_post.append(init_svn)
 
     bpy.app.handlers.save_post.append(init_svn)
@@ -409,6 +409,7 @@ def register():
 
 
 def unregister():
+    bpy.app.handlers.load_post.remove(clear_file_index_cache)
     bpy.app.handlers.load_post.remove(init_svn)
 
     bpy.app.handlers.save_post.remove(init_svn)
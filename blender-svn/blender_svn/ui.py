@@ -133,7 +133,6 @@ class SVN_UL_file_list(bpy.types.UIList):
         flt_neworder = helper_funcs.sort_items_by_name(list_items, "name")
 
         svn = context.scene.svn
-        has_default_status = lambda f: f.status == 'normal' and f.repos_status == 'none'
 
         if svn.search_filter:
             flt_flags = helper_funcs.filter_items_by_name(svn.search_filter, cls.UILST_FLT_ITEM, list_items, "name",
@@ -142,20 +141,28 @@ class SVN_UL_file_list(bpy.types.UIList):
             # Start with all files visible.
             flt_flags = [cls.UILST_FLT_ITEM] * len(list_items)
 
+            # Read filter settings once, instead of once per item.
+            only_referenced_files = svn.only_referenced_files
+            include_normal = svn.include_normal
+
             for i, item in enumerate(list_items):
-                if has_default_status(item) and not item.is_referenced:
+                # Each RNA property is only read once per item.
+                has_default_status = item.status == 'normal' and item.repos_status == 'none'
+                is_referenced = item.is_referenced
+
+                if has_default_status and not is_referenced:
                     # ALWAYS filter out files that have default statuses and aren't referenced.
                     flt_flags[i] = 0
 
-                if svn.only_referenced_files:
+                if only_referenced_files:
                     # Filter out files that are not being referenced, regardless of status.
-                    flt_flags[i] *= int(item.is_referenced)
-                    if has_default_status(item) and not svn.include_normal:
+                    flt_flags[i] *= int(is_referenced)
+                    if has_default_status and not include_normal:
                         # Filter out files that are being referenced but have default status.
                         flt_flags[i] = 0
                 else:
                     # Filter out files that have default status.
-                    if has_default_status(item):
+                    if has_default_status:
                         flt_flags[i] = 0
 
         return flt_flags, flt_neworder
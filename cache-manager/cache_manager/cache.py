@@ -29,6 +29,12 @@ from copy import deepcopy
 
 import bpy
 
+# Optional, not shipped with Blender. Serializes big cacheconfigs a lot faster.
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 from cache_manager import prefs, propsdata, cmglobals, opsdata
 from cache_manager.logger import LoggerFactory, log_new_lines
 
@@ -85,14 +91,30 @@ def get_ref_coll(coll: bpy.types.Collection) -> bpy.types.Collection:
 
 
 def read_json(filepath: Path) -> Any:
-    with open(filepath.as_posix(), "r") as file:
-        json_dict = json.loads(file.read())
-        return json_dict
+    # Cacheconfigs written by orjson are utf-8 and don't escape non ascii names.
+    with open(filepath, "r", encoding="utf-8") as file:
+        return json.load(file)
 
 
 def save_as_json(data: Any, filepath: Path) -> None:
-    with open(filepath.as_posix(), "w+") as file:
-        json.dump(data, file, indent=2)
+    # Cacheconfigs hold a value per frame for each animated property and get big.
+    # Encode them into one string and write it at once, instead of letting
+    # json.dump() write them to the file in many small chunks.
+    # orjson is optional and only used when it is installed. It writes the same
+    # 2 space indented layout, but refuses dicts with keys that are not strings,
+    # which the json module converts, so those still go through json.
+    if orjson:
+        try:
+            json_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        else:
+            filepath.write_bytes(json_bytes)
+            return
+
+    json_str = json.dumps(data, indent=2)
+    with open(filepath.as_posix(), "w") as file:
+        file.write(json_str)
 
 
 @contextlib.contextmanager
@@ -152,11 +174,9 @@ class CacheConfig:
     # Remapping.
     def get_coll_to_lib_mapping(self) -> Dict[str, str]:
         remapping = {}
-        for libfile in self._json_obj["libs"]:
-            for coll_str in self._json_obj["libs"][libfile]["data_from"]["collections"]:
-                for variant_name in self._json_obj["libs"][libfile]["data_from"][
-                    "collections"
-                ][coll_str]:
+        for libfile, libdict in self._json_obj["libs"].items():
+            for collvariants in libdict["data_from"]["collections"].values():
+                for variant_name in collvariants:
                     remapping[variant_name] = libfile
         return remapping
 
@@ -209,20 +229,33 @@ class CacheConfig:
 
 
 class CacheConfigBlueprint(CacheConfig):
-    _CACHECONFIG_TEMPL: Dict[str, Any] = {
-        "meta": {},
-        "libs": {},
-        "objects": {},
-        "cameras": {},
-    }
-    _LIBDICT_TEMPL: Dict[str, Any] = {
-        "data_from": {"collections": {}},  # {'colname': {'cachefile': cachepath}}
-    }
-    _OBJ_DICT_TEMPL: Dict[str, Any] = {"type": "", "abc_obj_path": "", "data_paths": {}}
-    _DATA_PATH_DICT: Dict[str, List[Any]] = {"value": []}
+    # Templates are built as literals, which is a lot cheaper than deepcopying
+    # a template dict for every lib, object and data path.
+    @staticmethod
+    def _new_cacheconfig_dict() -> Dict[str, Any]:
+        return {
+            "meta": {},
+            "libs": {},
+            "objects": {},
+            "cameras": {},
+        }
+
+    @staticmethod
+    def _new_lib_dict() -> Dict[str, Any]:
+        return {
+            "data_from": {"collections": {}},  # {'colname': {'cachefile': cachepath}}
+        }
+
+    @staticmethod
+    def _new_obj_dict() -> Dict[str, Any]:
+        return {"type": "", "abc_obj_path": "", "data_paths": {}}
+
+    @staticmethod
+    def _new_data_path_dict() -> Dict[str, List[Any]]:
+        return {"value": []}
 
     def __init__(self):
-        self._json_obj: Dict[str, Any] = deepcopy(self._CACHECONFIG_TEMPL)
+        self._json_obj: Dict[str, Any] = self._new_cacheconfig_dict()
 
     def init_by_file(self, filepath: Path) -> None:
         self._json_obj = read_json(filepath)
@@ -237,7 +270,9 @@ class CacheConfigBlueprint(CacheConfig):
 
     # Lib.
     def _ensure_lib(self, libfile: str) -> None:
-        self._json_obj["libs"].setdefault(libfile, deepcopy(self._LIBDICT_TEMPL))
+        libs = self._json_obj["libs"]
+        if libfile not in libs:
+            libs[libfile] = self._new_lib_dict()
 
     # Collection.
     def _ensure_coll_ref(self, libfile: str, coll_ref_name: str) -> None:
@@ -270,9 +305,9 @@ class CacheConfigBlueprint(CacheConfig):
 
     # Objs / Cameras.
     def _ensure_obj(self, obj_category: str, obj_name: str) -> None:
-        self._json_obj[obj_category].setdefault(
-            obj_name, deepcopy(self._OBJ_DICT_TEMPL)
-        )
+        objs = self._json_obj[obj_category]
+        if obj_name not in objs:
+            objs[obj_name] = self._new_obj_dict()
 
     def set_obj_key(
         self, obj_category: str, obj_name: str, key: str, value: Any
@@ -285,9 +320,9 @@ class CacheConfigBlueprint(CacheConfig):
         self, obj_category: str, obj_name: str, data_path: str
     ) -> None:
         self._ensure_obj(obj_category, obj_name)
-        self._json_obj[obj_category][obj_name]["data_paths"][data_path] = deepcopy(
-            self._DATA_PATH_DICT
-        )
+        self._json_obj[obj_category][obj_name]["data_paths"][
+            data_path
+        ] = self._new_data_path_dict()
 
     def append_value_to_data_path(
         self, obj_category: str, obj_name: str, data_path: str, value: Any
@@ -301,7 +336,7 @@ class CacheConfigBlueprint(CacheConfig):
         )
 
     def get_data_path_dict_templ(self) -> Dict[str, Any]:
-        return deepcopy(self._DRIVERDICT_TEMPL)
+        return self._new_data_path_dict()
 
 
 class CacheConfigProcessor:
@@ -311,21 +346,29 @@ class CacheConfigProcessor:
     ) -> List[bpy.types.Collection]:
 
         # Link collections in bpy.data of this blend file.
-        cls._import_data_from_libfiles(cacheconfig, link=link)
+        imported = cls._import_data_from_libfiles(cacheconfig, link=link)
 
         # Create.
-        colls = cls._instance_colls_to_scene_and_override(cacheconfig, context)
+        colls = cls._instance_colls_to_scene_and_override(
+            cacheconfig, context, imported
+        )
         return colls
 
     @classmethod
     def _import_data_from_libfiles(
         cls, cacheconfig: CacheConfig, link: bool = True
-    ) -> None:
+    ) -> List[Tuple[str, str]]:
+        """
+        Returns (libfile, coll_name) of all collections that exist in their libfile,
+        so they can be instanced without walking the cacheconfig again.
+        """
 
         noun = "Appended"
         if link:
             noun = "Linked"
 
+        imported: List[Tuple[str, str]] = []
+
         for libfile in cacheconfig.get_all_libfiles():
 
             libpath = Path(libfile)
@@ -347,6 +390,8 @@ class CacheConfigProcessor:
                         )
                         continue
 
+                    imported.append((libfile, coll_name))
+
                     if coll_name in data_to.collections:
                         logger.info("Collection %s already in blendfile.", coll_name)
                         continue
@@ -359,63 +404,67 @@ class CacheConfigProcessor:
                         libpath.as_posix(),
                     )
 
+        return imported
+
     @classmethod
     def _instance_colls_to_scene_and_override(
-        cls, cacheconfig: CacheConfig, context: bpy.types.Context
+        cls,
+        cacheconfig: CacheConfig,
+        context: bpy.types.Context,
+        imported: List[Tuple[str, str]],
     ) -> List[bpy.types.Collection]:
         # List of collections to track which ones got imported.
         colls: List[bpy.types.Collection] = []
 
-        for libfile in cacheconfig.get_all_libfiles():
+        # Link collections in current scene and add cm.cachfile property.
+        for libfile, coll_name in imported:
 
-            # Link collections in current scene and add cm.cachfile property.
-            for coll_name in cacheconfig.get_all_coll_ref_names(libfile):
+            # Source collection is the same for all variants, only get it once.
+            source_collection: Optional[bpy.types.Collection] = None
 
-                # For each variant add instance object.
-                for variant_name in sorted(
-                    cacheconfig.get_all_collvariants(libfile, coll_name)
-                ):
-                    if cls._is_coll_variant_in_blend(variant_name):
-                        logger.info("Collection %s already exists. Skip.", variant_name)
-                        continue
+            # For each variant add instance object.
+            collvariants = cacheconfig.get_all_collvariants(libfile, coll_name)
+            for variant_name in sorted(collvariants):
+                if cls._is_coll_variant_in_blend(variant_name):
+                    logger.info("Collection %s already exists. Skip.", variant_name)
+                    continue
 
-                    logger.info(
-                        "Collection variant %s does not exist yet. Will create.",
-                        variant_name,
-                    )
+                logger.info(
+                    "Collection variant %s does not exist yet. Will create.",
+                    variant_name,
+                )
 
-                    # Get source collection and create collection instance of it.
+                # Get source collection and create collection instance of it.
+                if not source_collection:
                     source_collection = get_ref_coll_by_name(coll_name)
-                    instance_obj = cls._create_collection_instance(
-                        source_collection, variant_name
-                    )
+                instance_obj = cls._create_collection_instance(
+                    source_collection, variant_name
+                )
 
-                    # Add library override to collection inst.
-                    cls._make_library_override(instance_obj, context)
+                # Add library override to collection inst.
+                cls._make_library_override(instance_obj, context)
 
-                    # Add collection properties.
+                # Add collection properties.
 
-                    coll = bpy.data.collections[variant_name, None]
-                    # TODO: Super risky but I found no other way around this
-                    # we have no influence on the naming of objects that will be created
-                    # by bpy.ops.object.make_override_library() -> we can just hope here
-                    # that there is not other object that would mess up the incrementation
-                    # -> cache would not work anymore with wrong incrementation.
-                    cachefile = cacheconfig.get_cachefile(
-                        libfile, coll_name, variant_name
-                    )
+                coll = bpy.data.collections[variant_name, None]
+                # TODO: Super risky but I found no other way around this
+                # we have no influence on the naming of objects that will be created
+                # by bpy.ops.object.make_override_library() -> we can just hope here
+                # that there is not other object that would mess up the incrementation
+                # -> cache would not work anymore with wrong incrementation.
+                cachefile = collvariants[variant_name]["cachefile"]
 
-                    # Set cm.cachefile property.
-                    coll.cm.cachefile = cachefile
-                    opsdata.add_coll_to_cache_collections(context, coll, "IMPORT")
-                    colls.append(coll)
+                # Set cm.cachefile property.
+                coll.cm.cachefile = cachefile
+                opsdata.add_coll_to_cache_collections(context, coll, "IMPORT")
+                colls.append(coll)
 
-                    logger.info(
-                        "%s assigned cachefile: %s (variant: %s)",
-                        coll.name,
-                        cachefile,
-                        variant_name,
-                    )
+                logger.info(
+                    "%s assigned cachefile: %s (variant: %s)",
+                    coll.name,
+                    cachefile,
+                    variant_name,
+                )
 
         return sorted(colls, key=lambda x: x.name)
 
@@ -686,11 +735,12 @@ class CacheConfigFactory:
     ) -> CacheConfigBlueprint:
 
         colls = sorted(colls, key=lambda x: x.name)
+        libfile_cache: Dict[str, str] = {}
 
         # Get libraries.
         for coll in colls:
 
-            libfile = opsdata.get_item_libfile(coll)
+            libfile = opsdata.get_item_libfile(coll, libfile_cache)
             coll_ref = get_ref_coll(coll)
 
             # Create collection dict based on this variant collection.
@@ -794,6 +844,8 @@ class CacheConfigFactory:
 
         obj_category = "cameras"
         cams_to_cache: List[bpy.types.Camera] = []
+        libfiles = blueprint.get_all_libfiles()
+        libfile_cache: Dict[str, str] = {}
 
         for cam in bpy.data.cameras:
 
@@ -811,10 +863,10 @@ class CacheConfigFactory:
                 )
                 continue
 
-            libfile = opsdata.get_item_libfile(cam)
+            libfile = opsdata.get_item_libfile(cam, libfile_cache)
 
             # Make sure to only export cams that are in current cache collections.
-            if libfile not in blueprint.get_all_libfiles():
+            if libfile not in libfiles:
                 continue
 
             # Set type.
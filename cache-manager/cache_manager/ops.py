@@ -55,13 +55,14 @@ class CM_OT_cache_export(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
-        # Remove invalid collections.
-        collections = [
-            coll
-            for coll in props.get_cache_collections_export(context)
-            if cache.is_valid_cache_coll(coll)
-        ]
-        return bool(context.scene.cm.is_cachedir_valid and collections)
+        # Needs at least one valid collection, stop at the first one.
+        return bool(
+            context.scene.cm.is_cachedir_valid
+            and any(
+                cache.is_valid_cache_coll(coll)
+                for coll in props.get_cache_collections_export(context)
+            )
+        )
 
     def execute(self, context: bpy.types.Context) -> Set[str]:
 
@@ -330,10 +331,12 @@ class CM_OT_cache_export(bpy.types.Operator):
     ) -> List[Tuple[bpy.types.Modifier, bool, bool]]:
 
         mods_to_restore_vis: List[Tuple[bpy.types.Modifier, bool, bool]] = []
+        mods_seen: Set[bpy.types.Modifier] = set()
 
         for arg in args:
             for mod, show_viewport, show_render in arg:
-                if mod not in [m for m, v, r in mods_to_restore_vis]:
+                if mod not in mods_seen:
+                    mods_seen.add(mod)
                     mods_to_restore_vis.append((mod, show_viewport, show_render))
 
         return mods_to_restore_vis
@@ -351,13 +354,14 @@ class CM_OT_cacheconfig_export(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
-        # Remove invalid collections.
-        collections = [
-            coll
-            for coll in props.get_cache_collections_export(context)
-            if cache.is_valid_cache_coll(coll)
-        ]
-        return bool(context.scene.cm.is_cachedir_valid and collections)
+        # Needs at least one valid collection, stop at the first one.
+        return bool(
+            context.scene.cm.is_cachedir_valid
+            and any(
+                cache.is_valid_cache_coll(coll)
+                for coll in props.get_cache_collections_export(context)
+            )
+        )
 
     def execute(self, context: bpy.types.Context) -> Set[str]:
         cacheconfig_path = context.scene.cm.cacheconfig_path
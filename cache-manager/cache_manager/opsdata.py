@@ -775,7 +775,7 @@ def add_coll_to_cache_collections(
         scn_category = scn.cm.colls_import
         idx = scn.cm.colls_import_index
 
-    if coll in [c[1].coll_ptr for c in scn_category.items()]:
+    if any(item.coll_ptr == coll for item in scn_category):
         logger.info(
             "%s already in the %s cache collections list", coll.name, category.lower()
         )
@@ -936,26 +936,40 @@ def is_item_lib_source(
 
 
 def get_item_libfile(
-    item: Union[bpy.types.Collection, bpy.types.Object, bpy.types.Camera]
+    item: Union[bpy.types.Collection, bpy.types.Object, bpy.types.Camera],
+    libfile_cache: Optional[Dict[str, str]] = None,
 ) -> str:
+    """
+    Returns the absolute path of the blend file the item comes from.
+    Pass the same libfile_cache dict when calling this for many items, so the
+    path of each library is only made absolute once.
+    """
     if is_item_lib_source(item):
         # Source collection not overwritten.
-        lib = item.library
-        return Path(os.path.abspath(bpy.path.abspath(lib.filepath))).as_posix()
+        filepath = item.library.filepath
 
-    if is_item_local(item):
+    elif is_item_local(item):
         # Local collection
         # blend file needs to be saved for that.
         if not bpy.data.filepath:
             return ""
-        return Path(os.path.abspath(bpy.path.abspath(bpy.data.filepath))).as_posix()
+        filepath = bpy.data.filepath
 
-    if is_item_lib_override(item):
+    elif is_item_lib_override(item):
         # Overwritten collection.
-        lib = item.override_library.reference.library
-        return Path(os.path.abspath(bpy.path.abspath(lib.filepath))).as_posix()
+        filepath = item.override_library.reference.library.filepath
+
+    else:
+        return ""
+
+    if libfile_cache is None:
+        return Path(os.path.abspath(bpy.path.abspath(filepath))).as_posix()
 
-    return ""
+    if filepath not in libfile_cache:
+        libfile_cache[filepath] = Path(
+            os.path.abspath(bpy.path.abspath(filepath))
+        ).as_posix()
+    return libfile_cache[filepath]
 
 
 def set_simplify(use_simplify: bool) -> None: